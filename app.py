@@ -1,8 +1,25 @@
+import base64
+import csv
+import io
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from functools import wraps
 
+import numpy as np
 from dotenv import load_dotenv
-from flask import Flask, jsonify, render_template, request
+from flask import (
+    Flask,
+    g,
+    has_request_context,
+    jsonify,
+    render_template,
+    request,
+    stream_with_context,
+)
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -16,13 +33,40 @@ from flask_login import (
 )
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf.csrf import CSRFProtect
-from sqlalchemy import text
+from sqlalchemy import and_, event, insert, or_, select, text, union, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import contains_eager, make_transient_to_detached
 from werkzeug.security import check_password_hash, generate_password_hash
 
 load_dotenv()
 
 app = Flask(__name__)
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///slashroll.db"
+app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv(
+    "DATABASE_URL", "sqlite:///slashroll.db"
+)
+
+# SQLite performance profile, applied to every new connection
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL").upper(),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL").upper(),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-64000")),  # negative = KiB
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY").upper(),
+}
+if SQLITE_PRAGMAS["journal_mode"] not in {
+    "DELETE",
+    "TRUNCATE",
+    "PERSIST",
+    "MEMORY",
+    "WAL",
+    "OFF",
+}:
+    raise ValueError("SQLITE_JOURNAL_MODE must be a valid SQLite journal mode")
+if SQLITE_PRAGMAS["synchronous"] not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+    raise ValueError("SQLITE_SYNCHRONOUS must be OFF, NORMAL, FULL or EXTRA")
+if SQLITE_PRAGMAS["temp_store"] not in {"DEFAULT", "FILE", "MEMORY"}:
+    raise ValueError("SQLITE_TEMP_STORE must be DEFAULT, FILE or MEMORY")
 
 # Critical security fix: Require SECRET_KEY environment variable
 SECRET_KEY = os.getenv("SECRET_KEY")
@@ -71,20 +115,237 @@ limiter = Limiter(
 
 db = SQLAlchemy(app)
 
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the SQLite performance profile to a new DB-API connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        # busy_timeout first so the journal mode switch can wait for locks
+        cursor.execute(f"PRAGMA busy_timeout = {SQLITE_PRAGMAS['busy_timeout']}")
+        cursor.execute(f"PRAGMA journal_mode = {SQLITE_PRAGMAS['journal_mode']}")
+        cursor.execute(f"PRAGMA synchronous = {SQLITE_PRAGMAS['synchronous']}")
+        cursor.execute(f"PRAGMA mmap_size = {SQLITE_PRAGMAS['mmap_size']}")
+        cursor.execute(f"PRAGMA cache_size = {SQLITE_PRAGMAS['cache_size']}")
+        cursor.execute(f"PRAGMA temp_store = {SQLITE_PRAGMAS['temp_store']}")
+    finally:
+        cursor.close()
+
+
+def log_sqlite_profile():
+    """Print the effective SQLite settings as reported by a live connection"""
+    settings = {
+        name: db.session.execute(text(f"PRAGMA {name}")).scalar()
+        for name in SQLITE_PRAGMAS
+    }
+    print(
+        "SQLite profile: "
+        + ", ".join(f"{name}={value}" for name, value in settings.items())
+    )
+
+
+# Per-request SQL instrumentation; a threshold of 0 disables the warning
+QUERY_WARN_THRESHOLD = int(os.getenv("QUERY_WARN_THRESHOLD", "20"))
+
+# Without an explicit level the app logger inherits WARNING and drops the
+# per-request INFO lines
+app.logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    """Remember when a statement started on this connection"""
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def record_query_time(conn, cursor, statement, parameters, context, executemany):
+    """Add a finished statement to the current request's query count and DB time"""
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    if has_request_context():
+        g.query_count = g.get("query_count", 0) + 1
+        g.query_time = g.get("query_time", 0.0) + elapsed
+
+
+def record_failed_query_time(exception_context):
+    """Count a failed statement too, so its start time doesn't linger on the stack"""
+    conn = exception_context.connection
+    # Errors raised before a statement reached the cursor never started a timer
+    if conn is None or exception_context.execution_context is None:
+        return
+    if conn.info.get("query_started"):
+        record_query_time(conn, None, None, None, None, None)
+
+
+with app.app_context():
+    if db.engine.dialect.name == "sqlite":
+        event.listen(db.engine, "connect", apply_sqlite_pragmas)
+    event.listen(db.engine, "before_cursor_execute", start_query_timer)
+    event.listen(db.engine, "after_cursor_execute", record_query_time)
+    event.listen(db.engine, "handle_error", record_failed_query_time)
+
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = "login"  # type: ignore
 
 
+class PrincipalCache:
+    """Per-worker TTL/LRU cache of logged-in principals keyed by prefixed session id
+
+    Entries hold the principal's column values and allowed team ids, so a
+    fresh session-bound instance can be rebuilt for each request without
+    loading the user. They are tagged with the shared access generation, which
+    every user or membership change bumps in SQLite, so all workers drop them
+    on their next lookup.
+    """
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, generation):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[-2] != generation or entry[-1] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[:-2]
+
+    def set(self, key, model, columns, team_ids, generation):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (
+                model,
+                columns,
+                team_ids,
+                generation,
+                time.monotonic() + self.ttl,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+principal_cache = PrincipalCache(
+    ttl=int(os.getenv("PRINCIPAL_CACHE_TTL", "30")),
+    max_size=int(os.getenv("PRINCIPAL_CACHE_SIZE", "1024")),
+)
+
+
+def access_generation():
+    """Read the shared access generation that cached principals are checked against"""
+    return db.session.query(AccessGeneration.generation).filter_by(id=1).scalar() or 0
+
+
+def bump_access_generation():
+    """Invalidate cached principals in every worker; call inside the write's
+    transaction"""
+    stmt = sqlite_insert(AccessGeneration.__table__).values(id=1, generation=1)
+    db.session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={"generation": AccessGeneration.generation + 1},
+        )
+    )
+
+
+class ResponseCache:
+    """Per-worker LRU cache of team-scoped GET response bodies
+
+    Entries are tagged with the team's data_version at render time. Writes bump
+    that version in SQLite, so every worker sees its entries for the team go
+    stale on the next lookup; the writing worker also drops them eagerly.
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != version:
+                self._drop(key)
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1:]
+
+    def set(self, key, version, body, mimetype):
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (version, body, mimetype)
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_team(self, team_id):
+        """Drop every cached response for a team"""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == team_id]:
+                self._drop(key)
+                self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("RESPONSE_CACHE_SIZE", "512")),
+    max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+)
+
+
 @login_manager.user_loader
 def load_user(user_id):
+    # Serve prefixed ids from the principal cache when possible; the generation
+    # is read first so a change committed meanwhile invalidates what we cache
+    generation = access_generation()
+    cached = principal_cache.get(user_id, generation)
+    if cached:
+        model, columns, team_ids = cached
+        user = model(**columns)
+        make_transient_to_detached(user)
+        user = db.session.merge(user, load=False)
+        g.allowed_team_ids = team_ids
+        return user
+
     # Handle prefixed user IDs to distinguish between user types
     if user_id.startswith("admin_"):
         actual_id = int(user_id.replace("admin_", ""))
-        return AdminUser.query.get(actual_id)
+        user = AdminUser.query.get(actual_id)
     elif user_id.startswith("user_"):
         actual_id = int(user_id.replace("user_", ""))
-        return User.query.get(actual_id)
+        user = User.query.get(actual_id)
     else:
         # For backward compatibility, try AdminUser first
         user = AdminUser.query.get(int(user_id))
@@ -92,6 +353,13 @@ def load_user(user_id):
             return user
         return User.query.get(int(user_id))
 
+    if user:
+        team_ids = team_ids_for(user)
+        g.allowed_team_ids = team_ids
+        columns = {c.key: getattr(user, c.key) for c in user.__table__.columns}
+        principal_cache.set(user_id, type(user), columns, team_ids, generation)
+    return user
+
 
 def get_user_teams():
     """Get all teams for the current authenticated user"""
@@ -110,6 +378,17 @@ def get_user_teams():
     return []
 
 
+def team_member_counts(teams):
+    """Count the assigned users of each team with one grouped query"""
+    if not teams:
+        return {}
+    return dict(
+        db.session.query(UserTeam.team_id, db.func.count(UserTeam.id))
+        .filter(UserTeam.team_id.in_([team.id for team in teams]))
+        .group_by(UserTeam.team_id)
+    )
+
+
 def is_superadmin():
     """Check if the current user is the superadmin"""
     if not current_user.is_authenticated:
@@ -122,6 +401,34 @@ def is_superadmin():
     )
 
 
+def team_ids_for(user):
+    """Get the ids of teams a principal may access"""
+    superadmin_username = os.getenv("su_username", "admin")
+    if isinstance(user, AdminUser) and user.username == superadmin_username:
+        return frozenset(team_id for (team_id,) in db.session.query(Team.id))
+
+    if isinstance(user, User):
+        return frozenset(
+            team_id
+            for (team_id,) in db.session.query(UserTeam.team_id).filter_by(
+                user_id=user.id
+            )
+        )
+
+    # For AdminUser (non-superadmin), no teams by default
+    return frozenset()
+
+
+def get_allowed_team_ids():
+    """Get the ids of teams the current user may access, computed once per request"""
+    if "allowed_team_ids" not in g:
+        if not current_user.is_authenticated:
+            g.allowed_team_ids = frozenset()
+        else:
+            g.allowed_team_ids = team_ids_for(current_user)
+    return g.allowed_team_ids
+
+
 def validate_team_access(team_id):
     """Validate that the current user has access to the specified team"""
     if not current_user.is_authenticated:
@@ -130,8 +437,132 @@ def validate_team_access(team_id):
     if not team_id:
         return False
 
-    user_teams = get_user_teams()
-    return any(team.id == team_id for team in user_teams)
+    return team_id in get_allowed_team_ids()
+
+
+def bump_team_version(team_id):
+    """Record that a team's data changed; call inside the write's transaction"""
+    if team_id:
+        Team.query.filter_by(id=team_id).update(
+            {Team.data_version: Team.data_version + 1}, synchronize_session=False
+        )
+        response_cache.invalidate_team(team_id)
+
+
+# Change log entries older than this are pruned
+CHANGE_LOG_RETENTION_DAYS = int(os.getenv("CHANGE_LOG_RETENTION_DAYS", "7"))
+CHANGE_LOG_PRUNE_INTERVAL = 3600
+_next_change_log_prune = 0.0
+
+
+def publish_change(team_id, entity, entity_ids, action="upsert"):
+    """Append change events to the team's change log; call inside the write's
+    transaction
+
+    The log lives in SQLite, so delta polls served by every worker see the
+    change. Expired entries are pruned at most once per interval per worker.
+    """
+    global _next_change_log_prune
+    if not team_id:
+        return
+    if time.monotonic() >= _next_change_log_prune:
+        _next_change_log_prune = time.monotonic() + CHANGE_LOG_PRUNE_INTERVAL
+        prune_change_log()
+    if isinstance(entity_ids, int):
+        entity_ids = [entity_ids]
+    rows = [
+        {"team_id": team_id, "entity": entity, "entity_id": entity_id, "action": action}
+        for entity_id in entity_ids
+    ]
+    if rows:
+        db.session.execute(insert(ChangeLog), rows)
+
+
+def prune_change_log():
+    """Delete change log entries older than the retention window
+
+    Each team's newest pruned entry is kept as a "pruned" marker, so the delta
+    endpoint can tell whether a client's sequence predates that team's retained
+    log. The newest entry overall is always kept: SQLite reuses the largest
+    rowid once it is deleted, which would make sequence numbers go backwards.
+    Returns the number of rows deleted; call inside a transaction.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=CHANGE_LOG_RETENTION_DAYS)
+    # Entries are appended in date order, so this only scans the expired ones
+    boundary = (
+        db.session.query(ChangeLog.id)
+        .filter(ChangeLog.date_created >= cutoff)
+        .order_by(ChangeLog.id)
+        .limit(1)
+        .scalar()
+    )
+    if boundary is None:
+        boundary = db.session.query(db.func.max(ChangeLog.id)).scalar()
+        if boundary is None:
+            return 0
+
+    markers = [
+        marker_id
+        for (marker_id,) in db.session.query(db.func.max(ChangeLog.id))
+        .filter(ChangeLog.id < boundary)
+        .group_by(ChangeLog.team_id)
+    ]
+    if not markers:
+        return 0
+    ChangeLog.query.filter(ChangeLog.id.in_(markers)).update(
+        {
+            ChangeLog.entity: "pruned",
+            ChangeLog.entity_id: 0,
+            ChangeLog.action: "pruned",
+        },
+        synchronize_session=False,
+    )
+    return ChangeLog.query.filter(
+        ChangeLog.id < boundary, ChangeLog.id.notin_(markers)
+    ).delete(synchronize_session=False)
+
+
+def team_etag_cached(view=None, team_id_for=None):
+    """Answer team-scoped GETs with 304 when the team's data version is unchanged
+
+    The ETag is derived from the team's data version only, so the check runs
+    before the view executes any of its own queries. Other callers on the team
+    are served the body cached for that version. The team comes from the
+    team_id query arg, or from team_id_for(**view_kwargs) when given.
+    """
+    if view is None:
+        return lambda view: team_etag_cached(view, team_id_for)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if team_id_for:
+            team_id = team_id_for(**kwargs)
+        else:
+            team_id = request.args.get("team_id", type=int)
+        if not team_id or not validate_team_access(team_id):
+            # Let the view produce its usual 400/403
+            return view(*args, **kwargs)
+
+        version = db.session.query(Team.data_version).filter_by(id=team_id).scalar()
+        etag = f"team-{team_id}-v{version}"
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            key = (request.path, team_id, tuple(sorted(request.args.items(multi=True))))
+            cached = response_cache.get(key, version)
+            if cached:
+                body, mimetype = cached
+                response = app.response_class(body, mimetype=mimetype)
+            else:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response_cache.set(key, version, response.get_data(), response.mimetype)
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+
+    return wrapper
 
 
 def validate_input_data(
@@ -165,6 +596,89 @@ def validate_input_data(
     return True, "Valid"
 
 
+MAX_PAGE_SIZE = 500
+
+
+def parse_page_args():
+    """Read optional `limit`/`cursor` query args; a None limit means unpaginated"""
+    limit = request.args.get("limit")
+    cursor = request.args.get("cursor")
+    if limit is None:
+        if cursor:
+            return None, None, "limit is required when cursor is given"
+        return None, None, None
+    try:
+        limit = int(limit)
+    except ValueError:
+        return None, None, "limit must be a number"
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        return None, None, f"limit must be between 1 and {MAX_PAGE_SIZE}"
+    return limit, cursor, None
+
+
+def encode_cursor(values):
+    """Encode keyset values as an opaque URL-safe cursor"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor, key_columns):
+    """Decode a cursor into values typed for key_columns; raises ValueError"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(payload, list) or len(payload) != len(key_columns):
+        raise ValueError("Invalid cursor")
+
+    values = []
+    for column, value in zip(key_columns, payload):
+        try:
+            if isinstance(column.type, db.DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, db.Integer):
+                value = int(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        values.append(value)
+    return values
+
+
+def keyset_page(query, key_columns, limit, cursor, descending=False, row_key=None):
+    """Fetch one keyset page of query ordered by key_columns
+
+    Returns (rows, next_cursor). ``row_key`` extracts the key values from a row
+    and defaults to reading the columns off an entity row. Raises ValueError
+    for a malformed cursor.
+    """
+    if row_key is None:
+
+        def row_key(row):
+            return [getattr(row, column.key) for column in key_columns]
+
+    if cursor:
+        values = decode_cursor(cursor, key_columns)
+        # Lexicographic "after the cursor" condition over the key columns
+        condition = None
+        for i in reversed(range(len(key_columns))):
+            column, value = key_columns[i], values[i]
+            after = column < value if descending else column > value
+            if condition is None:
+                condition = after
+            else:
+                condition = or_(after, and_(column == value, condition))
+        query = query.filter(condition)
+
+    ordering = [c.desc() if descending else c.asc() for c in key_columns]
+    rows = query.order_by(None).order_by(*ordering).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(row_key(rows[-1]))
+    return rows, next_cursor
+
+
 class AdminUser(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -214,11 +728,18 @@ class User(UserMixin, db.Model):
         return check_password_hash(self.password_hash, password)
 
     def get_teams(self):
-        """Get all teams this user is assigned to"""
-        return [ut.team for ut in self.user_teams]
+        """Get all teams this user is assigned to, in one query"""
+        return (
+            Team.query.join(UserTeam, UserTeam.team_id == Team.id)
+            .filter(UserTeam.user_id == self.id)
+            .order_by(UserTeam.id)
+            .all()
+        )
 
-    def to_dict(self):
-        teams = self.get_teams()
+    def to_dict(self, teams=None):
+        # Callers that already loaded the user's teams pass them in
+        if teams is None:
+            teams = self.get_teams()
         return {
             "id": self.id,
             "username": self.username,
@@ -234,18 +755,23 @@ class Team(db.Model):
     date_created = db.Column(
         db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
     )
+    # Bumped by every write to the team's data; drives ETags on team-scoped reads
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     def get_users(self):
         """Get all users assigned to this team"""
         return [tu.user for tu in self.team_users]
 
-    def to_dict(self):
+    def to_dict(self, member_count=None):
+        # Listings pass pre-aggregated counts to avoid per-team lazy loads
+        if member_count is None:
+            member_count = len(self.team_users)
         return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
             "date_created": self.date_created.isoformat(),
-            "member_count": len(self.team_users),
+            "member_count": member_count,
         }
 
 
@@ -286,6 +812,8 @@ class Season(db.Model):
 
     team = db.relationship("Team", backref="seasons")
 
+    __table_args__ = (db.Index("ix_season_team_created", "team_id", "date_created"),)
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -312,6 +840,8 @@ class Player(db.Model):
     season = db.relationship("Season", backref="players")
     team = db.relationship("Team", backref="players")
 
+    __table_args__ = (db.Index("ix_player_team_status", "team_id", "status"),)
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -367,13 +897,25 @@ class Battle(db.Model):
     season = db.relationship("Season", backref="battles")
     team = db.relationship("Team", backref="battles")
 
-    def to_dict(self):
-        try:
-            total_damage = sum(p.damage_done for p in self.participants)
-        except Exception:
-            # If participants aren't loaded, query them directly
-            participants = BattleParticipant.query.filter_by(battle_id=self.id).all()
-            total_damage = sum(p.damage_done for p in participants)
+    __table_args__ = (
+        db.Index(
+            "ix_battle_team_season_created", "team_id", "season_id", "date_created"
+        ),
+    )
+
+    def to_dict(self, total_damage=None, team_name=None):
+        # Listings pass pre-aggregated values to avoid per-battle lazy loads
+        if total_damage is None:
+            try:
+                total_damage = sum(p.damage_done for p in self.participants)
+            except Exception:
+                # If participants aren't loaded, query them directly
+                participants = BattleParticipant.query.filter_by(
+                    battle_id=self.id
+                ).all()
+                total_damage = sum(p.damage_done for p in participants)
+        if team_name is None and self.team_id:
+            team_name = self.team.name if self.team else None
 
         return {
             "id": self.id,
@@ -385,7 +927,7 @@ class Battle(db.Model):
             "total_damage": total_damage,
             "season_id": self.season_id,
             "team_id": self.team_id,
-            "team_name": self.team.name if self.team else None,
+            "team_name": team_name,
         }
 
 
@@ -399,6 +941,11 @@ class BattleParticipant(db.Model):
     battle = db.relationship("Battle", backref="participants")
     player = db.relationship("Player", backref="battle_participations")
 
+    __table_args__ = (
+        db.Index("ix_battle_participant_player_battle", "player_id", "battle_id"),
+        db.Index("ix_battle_participant_battle", "battle_id"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -410,6 +957,191 @@ class BattleParticipant(db.Model):
         }
 
 
+class ChangeLog(db.Model):
+    """Log of team data changes, read by the delta endpoint until pruned"""
+
+    __tablename__ = "change_log"
+
+    id = db.Column(db.Integer, primary_key=True)
+    team_id = db.Column(db.Integer, nullable=False)
+    entity = db.Column(db.String(20), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    action = db.Column(db.String(10), nullable=False)
+    date_created = db.Column(
+        db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (db.Index("ix_change_log_team_id", "team_id", "id"),)
+
+
+class AccessGeneration(db.Model):
+    """Single-row counter bumped by every change to users or team memberships"""
+
+    __tablename__ = "access_generation"
+
+    id = db.Column(db.Integer, primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+
+
+class PlayerSeasonStats(db.Model):
+    """Per-player battle totals for a team's season, maintained incrementally
+
+    Battles recorded without a team or season are kept under id 0.
+    """
+
+    __tablename__ = "player_season_stats"
+
+    team_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    season_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    player_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    total_damage = db.Column(db.Integer, nullable=False, default=0)
+    total_shields_broken = db.Column(db.Integer, nullable=False, default=0)
+    battle_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+def apply_stats_deltas(team_id, season_id, deltas):
+    """Add per-player (damage, shields, battles) deltas to the stats table
+
+    Runs as one upsert executemany inside the caller's transaction; rows whose
+    battle count drops to zero are removed.
+    """
+    team_key, season_key = team_id or 0, season_id or 0
+    rows = [
+        {
+            "team_id": team_key,
+            "season_id": season_key,
+            "player_id": player_id,
+            "total_damage": damage,
+            "total_shields_broken": shields,
+            "battle_count": battles,
+        }
+        for player_id, (damage, shields, battles) in deltas.items()
+        if damage or shields or battles
+    ]
+    if not rows:
+        return
+
+    stmt = sqlite_insert(PlayerSeasonStats.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["team_id", "season_id", "player_id"],
+        set_={
+            "total_damage": PlayerSeasonStats.total_damage + stmt.excluded.total_damage,
+            "total_shields_broken": PlayerSeasonStats.total_shields_broken
+            + stmt.excluded.total_shields_broken,
+            "battle_count": PlayerSeasonStats.battle_count + stmt.excluded.battle_count,
+        },
+    )
+    db.session.execute(stmt, rows)
+
+    if any(row["battle_count"] < 0 for row in rows):
+        PlayerSeasonStats.query.filter(
+            PlayerSeasonStats.team_id == team_key,
+            PlayerSeasonStats.season_id == season_key,
+            PlayerSeasonStats.player_id.in_([row["player_id"] for row in rows]),
+            PlayerSeasonStats.battle_count <= 0,
+        ).delete(synchronize_session=False)
+
+
+def participant_stats_deltas(participant_rows, sign=1):
+    """Sum participant rows into per-player (damage, shields, battles) deltas"""
+    deltas = {}
+    for row in participant_rows:
+        damage, shields, battles = deltas.get(row["player_id"], (0, 0, 0))
+        deltas[row["player_id"]] = (
+            damage + sign * row["damage_done"],
+            shields + sign * row["shields_broken"],
+            battles + sign,
+        )
+    return deltas
+
+
+def recomputed_stats_query():
+    """Select player season stats recomputed from raw battle participants"""
+    team_key = db.func.coalesce(Battle.team_id, 0)
+    season_key = db.func.coalesce(Battle.season_id, 0)
+    return (
+        select(
+            team_key.label("team_id"),
+            season_key.label("season_id"),
+            BattleParticipant.player_id,
+            db.func.sum(BattleParticipant.damage_done).label("total_damage"),
+            db.func.sum(BattleParticipant.shields_broken).label("total_shields_broken"),
+            db.func.count(BattleParticipant.id).label("battle_count"),
+        )
+        .join(Battle, Battle.id == BattleParticipant.battle_id)
+        .group_by(team_key, season_key, BattleParticipant.player_id)
+    )
+
+
+def rebuild_player_season_stats():
+    """Recompute the whole stats table from battle participants"""
+    PlayerSeasonStats.query.delete(synchronize_session=False)
+    db.session.execute(
+        insert(PlayerSeasonStats).from_select(
+            [
+                "team_id",
+                "season_id",
+                "player_id",
+                "total_damage",
+                "total_shields_broken",
+                "battle_count",
+            ],
+            recomputed_stats_query(),
+        )
+    )
+    db.session.commit()
+
+
+def find_stats_mismatches():
+    """Return (key, stored, expected) for stats rows that disagree with raw data"""
+    stored = {
+        (row.team_id, row.season_id, row.player_id): (
+            row.total_damage,
+            row.total_shields_broken,
+            row.battle_count,
+        )
+        for row in PlayerSeasonStats.query
+    }
+    expected = {
+        tuple(row[:3]): tuple(row[3:])
+        for row in db.session.execute(recomputed_stats_query())
+    }
+    return [
+        (key, stored.get(key), expected.get(key))
+        for key in sorted(stored.keys() | expected.keys())
+        if stored.get(key) != expected.get(key)
+    ]
+
+
+@app.cli.command("rebuild-stats")
+def rebuild_stats_command():
+    """Rebuild the player_season_stats table from battle history"""
+    rebuild_player_season_stats()
+    print(f"Rebuilt {PlayerSeasonStats.query.count()} player season stats rows")
+
+
+@app.cli.command("check-stats")
+def check_stats_command():
+    """Verify player_season_stats matches the raw battle participant data"""
+    mismatches = find_stats_mismatches()
+    for key, stored, expected in mismatches:
+        print(
+            f"MISMATCH team={key[0]} season={key[1]} player={key[2]}: "
+            f"stored={stored} expected={expected}"
+        )
+    if mismatches:
+        raise SystemExit(1)
+    print("Player season stats are consistent")
+
+
+@app.cli.command("prune-changes")
+def prune_changes_command():
+    """Delete change log entries older than CHANGE_LOG_RETENTION_DAYS"""
+    deleted = prune_change_log()
+    db.session.commit()
+    print(f"Pruned {deleted} change log entries")
+
+
 @app.route("/")
 def index():
     if not current_user.is_authenticated:
@@ -474,7 +1206,10 @@ def get_auth_teams():
     try:
         # Get teams for the current authenticated user
         teams = get_user_teams()
-        return jsonify([team.to_dict() for team in teams])
+        member_counts = team_member_counts(teams)
+        return jsonify(
+            [team.to_dict(member_count=member_counts.get(team.id, 0)) for team in teams]
+        )
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -483,8 +1218,21 @@ def get_auth_teams():
 @app.route("/api/users", methods=["GET"])
 @login_required
 def get_users():
-    users = User.query.all()
-    return jsonify([user.to_dict() for user in users])
+    limit, cursor, error_msg = parse_page_args()
+    if error_msg:
+        return jsonify({"error": error_msg}), 400
+
+    if limit is None:
+        users = User.query.all()
+        return jsonify([user.to_dict() for user in users])
+
+    try:
+        users, next_cursor = keyset_page(User.query, [User.id], limit, cursor)
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    return jsonify(
+        {"items": [user.to_dict() for user in users], "next_cursor": next_cursor}
+    )
 
 
 @app.route("/api/users", methods=["POST"])
@@ -546,6 +1294,7 @@ def update_user(user_id):
         user.set_password(new_password)
 
     try:
+        bump_access_generation()
         db.session.commit()
         return jsonify(user.to_dict()), 200
     except Exception:
@@ -560,6 +1309,7 @@ def delete_user(user_id):
 
     try:
         db.session.delete(user)
+        bump_access_generation()
         db.session.commit()
         return jsonify({"message": "User deleted successfully"}), 200
     except Exception:
@@ -571,8 +1321,21 @@ def delete_user(user_id):
 @app.route("/api/teams", methods=["GET"])
 @login_required
 def get_teams():
-    teams = Team.query.all()
-    return jsonify([team.to_dict() for team in teams])
+    limit, cursor, error_msg = parse_page_args()
+    if error_msg:
+        return jsonify({"error": error_msg}), 400
+
+    if limit is None:
+        teams = Team.query.all()
+        return jsonify([team.to_dict() for team in teams])
+
+    try:
+        teams, next_cursor = keyset_page(Team.query, [Team.id], limit, cursor)
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    return jsonify(
+        {"items": [team.to_dict() for team in teams], "next_cursor": next_cursor}
+    )
 
 
 @app.route("/api/teams", methods=["POST"])
@@ -592,6 +1355,8 @@ def create_team():
 
     try:
         db.session.add(team)
+        # The superadmin's allowed team set changed
+        bump_access_generation()
         db.session.commit()
         return jsonify(team.to_dict()), 201
     except Exception:
@@ -628,6 +1393,8 @@ def update_team(team_id):
         team.description = data["description"].strip() or None
 
     try:
+        bump_team_version(team.id)
+        publish_change(team.id, "team", team.id)
         db.session.commit()
         return jsonify(team.to_dict()), 200
     except Exception:
@@ -649,7 +1416,28 @@ def delete_team(team_id):
         ), 400
 
     try:
-        db.session.delete(team)
+        # Players, seasons and battles outlive the team, detached from it as
+        # before; their stats move to the no-team key
+        stats_by_season = {}
+        for stats in PlayerSeasonStats.query.filter_by(team_id=team_id):
+            stats_by_season.setdefault(stats.season_id, {})[stats.player_id] = (
+                stats.total_damage,
+                stats.total_shields_broken,
+                stats.battle_count,
+            )
+        PlayerSeasonStats.query.filter_by(team_id=team_id).delete(
+            synchronize_session=False
+        )
+        for season_id, deltas in stats_by_season.items():
+            apply_stats_deltas(None, season_id, deltas)
+        for model in (Player, Season, Battle, User):
+            model.query.filter_by(team_id=team_id).update(
+                {"team_id": None}, synchronize_session=False
+            )
+        Team.query.filter_by(id=team_id).delete(synchronize_session=False)
+        publish_change(team_id, "team", team_id, "delete")
+        # The superadmin's allowed team set changed
+        bump_access_generation()
         db.session.commit()
         return jsonify({"message": "Team deleted successfully"}), 200
     except Exception:
@@ -692,6 +1480,7 @@ def update_user_teams(user_id):
             user_team = UserTeam(user_id=user_id, team_id=team_id)
             db.session.add(user_team)
 
+        bump_access_generation()
         db.session.commit()
         return jsonify(user.to_dict()), 200
     except Exception:
@@ -714,6 +1503,7 @@ def assign_user_to_team(user_id, team_id):
     try:
         user_team = UserTeam(user_id=user_id, team_id=team_id)
         db.session.add(user_team)
+        bump_access_generation()
         db.session.commit()
         return jsonify(user_team.to_dict()), 201
     except Exception:
@@ -734,6 +1524,7 @@ def remove_user_from_team(user_id, team_id):
 
     try:
         db.session.delete(user_team)
+        bump_access_generation()
         db.session.commit()
         return jsonify({"message": "User removed from team successfully"}), 200
     except Exception:
@@ -743,6 +1534,7 @@ def remove_user_from_team(user_id, team_id):
 
 @app.route("/api/players", methods=["GET"])
 @login_required
+@team_etag_cached
 def get_players():
     status = request.args.get("status", "active")
     season_id = request.args.get("season_id")
@@ -756,59 +1548,118 @@ def get_players():
     if not validate_team_access(int(team_id)):
         return jsonify({"error": "Access denied to this team"}), 403
 
+    limit, cursor, error_msg = parse_page_args()
+    if error_msg:
+        return jsonify({"error": error_msg}), 400
+
     query = Player.query.filter_by(team_id=team_id)
     if season_id:
         query = query.filter_by(season_id=season_id)
+    if status != "all":
+        query = query.filter_by(status=status)
 
-    if status == "all":
+    next_cursor = None
+    if limit is None:
         players = query.all()
+    else:
+        try:
+            players, next_cursor = keyset_page(query, [Player.id], limit, cursor)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    if status == "all":
         # For management view, include all seasons a player is involved in
-        players_data = []
-        for player in players:
-            player_data = player.to_dict()
-            # Get all seasons this player is involved in (roster or battles)
-            season_ids = set()
-            if player.season_id:
-                season_ids.add(player.season_id)
-
-            # Add seasons from roster participation
-            roster_seasons = (
-                db.session.query(SeasonRoster.season_id)
-                .filter_by(player_id=player.id)
-                .all()
+        # (own season, roster or battles), resolved for the whole team at once
+        own_seasons = select(
+            Player.id.label("player_id"), Player.season_id.label("season_id")
+        ).where(Player.team_id == team_id, Player.season_id.isnot(None))
+        roster_seasons = (
+            select(SeasonRoster.player_id, SeasonRoster.season_id)
+            .join(Player, Player.id == SeasonRoster.player_id)
+            .where(Player.team_id == team_id)
+        )
+        battle_seasons = (
+            select(BattleParticipant.player_id, Battle.season_id)
+            .join(Battle, Battle.id == BattleParticipant.battle_id)
+            .join(Player, Player.id == BattleParticipant.player_id)
+            .where(Player.team_id == team_id, Battle.season_id.isnot(None))
+        )
+        memberships = union(own_seasons, roster_seasons, battle_seasons).subquery()
+
+        # Get season names (only from the same team)
+        membership_query = (
+            db.session.query(memberships.c.player_id, Season.id, Season.name)
+            .join(Season, Season.id == memberships.c.season_id)
+            .filter(Season.team_id == team_id)
+            .order_by(Season.id)
+        )
+        if limit is not None:
+            membership_query = membership_query.filter(
+                memberships.c.player_id.in_([player.id for player in players])
             )
-            for season_id_tuple in roster_seasons:
-                season_ids.add(season_id_tuple[0])
-
-            # Add seasons from battle participation
-            battle_seasons = (
-                db.session.query(Battle.season_id)
-                .join(BattleParticipant)
-                .filter(BattleParticipant.player_id == player.id)
-                .all()
+        membership_rows = membership_query.all()
+        seasons_by_player = {}
+        for player_id, season_id_value, season_name in membership_rows:
+            seasons_by_player.setdefault(player_id, []).append(
+                {"id": season_id_value, "name": season_name}
             )
-            for season_id_tuple in battle_seasons:
-                if season_id_tuple[0]:
-                    season_ids.add(season_id_tuple[0])
-
-            # Get season names (only from the same team)
-            if season_ids:
-                seasons = Season.query.filter(
-                    Season.id.in_(season_ids), Season.team_id == team_id
-                ).all()
-                player_data["seasons"] = [{"id": s.id, "name": s.name} for s in seasons]
-            else:
-                player_data["seasons"] = []
 
+        players_data = []
+        for player in players:
+            player_data = player.to_dict()
+            player_data["seasons"] = seasons_by_player.get(player.id, [])
             players_data.append(player_data)
-        return jsonify(players_data)
     else:
-        players = query.filter_by(status=status).all()
-        return jsonify([player.to_dict() for player in players])
+        players_data = [player.to_dict() for player in players]
+
+    if limit is None:
+        return jsonify(players_data)
+    return jsonify({"items": players_data, "next_cursor": next_cursor})
+
+
+def season_roster_data(season_id, team_id):
+    """Serialize a season's active roster for a team, ordered by position"""
+    season_rosters = (
+        SeasonRoster.query.filter_by(season_id=season_id)
+        .join(Player)
+        .options(contains_eager(SeasonRoster.player))
+        .filter(Player.status == "active", Player.team_id == team_id)
+        .order_by(SeasonRoster.roster_position)
+        .all()
+    )
+    roster_data = []
+    for sr in season_rosters:
+        player_data = sr.player.to_dict()
+        player_data["roster_position"] = sr.roster_position
+        roster_data.append(player_data)
+    return roster_data
+
+
+def reposition_roster_entries(moves):
+    """Move SeasonRoster rows to new positions without tripping the unique constraint
+
+    ``moves`` is a list of (SeasonRoster, new_position) pairs. The rows are first
+    parked at their negated positions in one UPDATE, then written to their final
+    positions with a single bulk update, all inside the caller's transaction.
+    """
+    if not moves:
+        return
+
+    SeasonRoster.query.filter(
+        SeasonRoster.id.in_([entry.id for entry, _ in moves])
+    ).update(
+        {SeasonRoster.roster_position: -SeasonRoster.roster_position},
+        synchronize_session=False,
+    )
+    db.session.execute(
+        update(SeasonRoster),
+        [{"id": entry.id, "roster_position": position} for entry, position in moves],
+    )
 
 
 @app.route("/api/players/roster", methods=["GET"])
 @login_required
+@team_etag_cached
 def get_roster():
     season_id = request.args.get("season_id")
     team_id = request.args.get("team_id")
@@ -823,19 +1674,7 @@ def get_roster():
 
     if season_id:
         # Use new SeasonRoster table with team validation
-        season_rosters = (
-            SeasonRoster.query.filter_by(season_id=season_id)
-            .join(Player)
-            .filter(Player.status == "active", Player.team_id == team_id)
-            .order_by(SeasonRoster.roster_position)
-            .all()
-        )
-        roster_data = []
-        for sr in season_rosters:
-            player_data = sr.player.to_dict()
-            player_data["roster_position"] = sr.roster_position
-            roster_data.append(player_data)
-        return jsonify(roster_data)
+        return jsonify(season_roster_data(season_id, team_id))
     else:
         # Fallback to old method for backward compatibility with team filter
         query = Player.query.filter_by(status="active", team_id=team_id).filter(
@@ -867,6 +1706,8 @@ def update_player_status(player_id):
         player.roster_position = None
 
     try:
+        bump_team_version(player.team_id)
+        publish_change(player.team_id, "player", player.id)
         db.session.commit()
         return jsonify(player.to_dict()), 200
     except Exception:
@@ -874,6 +1715,83 @@ def update_player_status(player_id):
         return jsonify({"error": "Failed to update player status"}), 500
 
 
+@app.route("/api/players/status", methods=["PUT"])
+@login_required
+def bulk_update_player_status():
+    data = request.get_json()
+
+    if not data or "status" not in data:
+        return jsonify({"error": "Status is required"}), 400
+
+    if data["status"] not in ["active", "inactive"]:
+        return jsonify({"error": "Status must be active or inactive"}), 400
+
+    player_ids = data.get("player_ids")
+    if (
+        not isinstance(player_ids, list)
+        or not player_ids
+        or not all(
+            isinstance(pid, int) and not isinstance(pid, bool) for pid in player_ids
+        )
+    ):
+        return jsonify({"error": "player_ids must be a non-empty list of ids"}), 400
+    player_ids = set(player_ids)
+
+    # Validate team access for every player in one query
+    team_by_player = dict(
+        db.session.query(Player.id, Player.team_id).filter(Player.id.in_(player_ids))
+    )
+    missing = player_ids - team_by_player.keys()
+    if missing:
+        return jsonify({"error": f"Players not found: {sorted(missing)}"}), 404
+    team_ids = set(team_by_player.values())
+    if not all(validate_team_access(team_id) for team_id in team_ids):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    # Inactive players drop their legacy roster position in the same statement
+    values = {Player.status: data["status"]}
+    if data["status"] == "inactive":
+        values[Player.roster_position] = None
+
+    try:
+        Player.query.filter(Player.id.in_(player_ids)).update(
+            values, synchronize_session=False
+        )
+
+        # Inactive players leave their season rosters in one DELETE
+        affected_rosters = []
+        if data["status"] == "inactive":
+            affected_rosters = (
+                db.session.query(SeasonRoster.season_id, Season.team_id)
+                .join(Season, Season.id == SeasonRoster.season_id)
+                .filter(SeasonRoster.player_id.in_(player_ids))
+                .distinct()
+                .all()
+            )
+            SeasonRoster.query.filter(SeasonRoster.player_id.in_(player_ids)).delete(
+                synchronize_session=False
+            )
+
+        for team_id in team_ids:
+            bump_team_version(team_id)
+            publish_change(
+                team_id,
+                "player",
+                [pid for pid, tid in team_by_player.items() if tid == team_id],
+            )
+            publish_change(
+                team_id,
+                "roster",
+                [sid for sid, tid in affected_rosters if tid == team_id],
+            )
+        db.session.commit()
+        players = Player.query.filter(Player.id.in_(player_ids)).order_by(Player.id)
+        return jsonify([player.to_dict() for player in players]), 200
+    except Exception:
+        db.session.rollback()
+        return jsonify({"error": "Failed to update player status"}), 500
+
+
 @app.route("/api/players/<int:player_id>/roster", methods=["PUT"])
 @login_required
 def update_roster_position(player_id):
@@ -917,12 +1835,11 @@ def update_roster_position(player_id):
                 season_id=season_id, player_id=player_id
             ).delete()
 
-            # Remove any existing player at this position in this season
-            existing_roster = SeasonRoster.query.filter_by(
+            # Remove any existing player at this position in this season; a
+            # bulk delete runs before the insert below is flushed
+            SeasonRoster.query.filter_by(
                 season_id=season_id, roster_position=position
-            ).first()
-            if existing_roster:
-                db.session.delete(existing_roster)
+            ).delete()
 
             # Add new roster entry
             new_roster = SeasonRoster(
@@ -939,6 +1856,11 @@ def update_roster_position(player_id):
             player.roster_position = position
 
     try:
+        bump_team_version(player.team_id)
+        if season_id:
+            publish_change(player.team_id, "roster", season_id)
+        else:
+            publish_change(player.team_id, "player", player.id)
         db.session.commit()
         # Return player data with updated roster position
         player_data = player.to_dict()
@@ -978,31 +1900,25 @@ def swap_roster_positions():
         if not roster1 or not roster2:
             return jsonify({"error": "One or both players not found in roster"}), 400
 
+        # Validate team access for the season's roster
+        if not validate_team_access(roster1.season.team_id):
+            return jsonify({"error": "Access denied to this team"}), 403
+
         # Store original positions
         pos1 = roster1.roster_position
         pos2 = roster2.roster_position
 
-        # Use a temporary position to avoid constraint violation
-        # Use a position higher than 20 as temporary (like 999)
-        temp_position = 999
-
-        # Step 1: Move first player to temporary position
-        roster1.roster_position = temp_position
-        db.session.commit()
-
-        # Step 2: Move second player to first player's original position
-        roster2.roster_position = pos1
-        db.session.commit()
-
-        # Step 3: Move first player to second player's original position
-        roster1.roster_position = pos2
+        # Swap both positions in a single transaction
+        reposition_roster_entries([(roster1, pos2), (roster2, pos1)])
+        bump_team_version(roster1.season.team_id)
+        publish_change(roster1.season.team_id, "roster", season_id)
         db.session.commit()
 
         return jsonify(
             {
                 "message": "Players swapped successfully",
-                "player1": {"id": player1_id, "position": roster1.roster_position},
-                "player2": {"id": player2_id, "position": roster2.roster_position},
+                "player1": {"id": player1_id, "position": pos2},
+                "player2": {"id": player2_id, "position": pos1},
             }
         ), 200
 
@@ -1012,24 +1928,125 @@ def swap_roster_positions():
         return jsonify({"error": f"Failed to swap roster positions: {str(e)}"}), 500
 
 
-@app.route("/api/players", methods=["POST"])
+@app.route("/api/players/roster", methods=["PUT"])
 @login_required
-def add_player():
+def update_roster_order():
     data = request.get_json()
 
-    # Input validation
-    is_valid, error_msg = validate_input_data(
-        data,
-        required_fields=["name", "team_id"],
-        max_lengths={"name": 100, "game_id": 50},
-    )
-    if not is_valid:
-        return jsonify({"error": error_msg}), 400
+    if not data or "roster" not in data:
+        return jsonify({"error": "roster array is required"}), 400
 
-    # Get team_id (already validated above)
+    season_id = data.get("season_id")
     team_id = data.get("team_id")
 
-    # Validate team access
+    if not team_id:
+        return jsonify({"error": "Team ID is required"}), 400
+    if not season_id:
+        return jsonify({"error": "Season ID is required"}), 400
+
+    # Validate team access
+    if not validate_team_access(team_id):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    # Validate season belongs to the same team
+    season = Season.query.get(season_id)
+    if not season or season.team_id != team_id:
+        return jsonify({"error": "Season does not belong to this team"}), 400
+
+    # Validate the desired ordering
+    desired = {}
+    for entry in data["roster"]:
+        player_id = entry.get("player_id")
+        position = entry.get("roster_position")
+        if not isinstance(player_id, int) or not isinstance(position, int):
+            return jsonify(
+                {"error": "Each roster entry needs a player_id and roster_position"}
+            ), 400
+        if position < 1 or position > 20:
+            return jsonify({"error": "Roster position must be between 1 and 20"}), 400
+        if player_id in desired:
+            return jsonify({"error": f"Player {player_id} is listed twice"}), 400
+        desired[player_id] = position
+
+    if len(set(desired.values())) != len(desired):
+        return jsonify({"error": "Roster positions must be unique"}), 400
+
+    # Validate all players belong to the team and are active in one query
+    if desired:
+        statuses = dict(
+            db.session.query(Player.id, Player.status).filter(
+                Player.id.in_(desired.keys()), Player.team_id == team_id
+            )
+        )
+        for player_id in desired:
+            if player_id not in statuses:
+                return jsonify(
+                    {"error": f"Player {player_id} does not belong to this team"}
+                ), 400
+            if statuses[player_id] != "active":
+                return jsonify(
+                    {"error": "Only active players can be added to roster"}
+                ), 400
+
+    try:
+        existing = SeasonRoster.query.filter_by(season_id=season_id).all()
+        existing_players = {entry.player_id for entry in existing}
+
+        # Drop entries for players no longer on the roster (this includes
+        # hidden entries of inactive players, which would otherwise block slots)
+        delete_ids = [e.id for e in existing if e.player_id not in desired]
+        if delete_ids:
+            SeasonRoster.query.filter(SeasonRoster.id.in_(delete_ids)).delete(
+                synchronize_session=False
+            )
+
+        # Move entries that changed position
+        reposition_roster_entries(
+            [
+                (entry, desired[entry.player_id])
+                for entry in existing
+                if entry.player_id in desired
+                and entry.roster_position != desired[entry.player_id]
+            ]
+        )
+
+        # Add players that were not on the roster yet
+        new_entries = [
+            {"season_id": season_id, "player_id": player_id, "roster_position": pos}
+            for player_id, pos in desired.items()
+            if player_id not in existing_players
+        ]
+        if new_entries:
+            db.session.execute(insert(SeasonRoster), new_entries)
+
+        bump_team_version(team_id)
+        publish_change(team_id, "roster", season_id)
+        db.session.commit()
+        return jsonify(season_roster_data(season_id, team_id)), 200
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error updating roster order: {str(e)}")
+        return jsonify({"error": f"Failed to update roster order: {str(e)}"}), 500
+
+
+@app.route("/api/players", methods=["POST"])
+@login_required
+def add_player():
+    data = request.get_json()
+
+    # Input validation
+    is_valid, error_msg = validate_input_data(
+        data,
+        required_fields=["name", "team_id"],
+        max_lengths={"name": 100, "game_id": 50},
+    )
+    if not is_valid:
+        return jsonify({"error": error_msg}), 400
+
+    # Get team_id (already validated above)
+    team_id = data.get("team_id")
+
+    # Validate team access
     if not validate_team_access(team_id):
         return jsonify({"error": "Access denied to this team"}), 403
 
@@ -1052,6 +2069,9 @@ def add_player():
 
     try:
         db.session.add(player)
+        db.session.flush()  # Get the player ID
+        bump_team_version(team_id)
+        publish_change(team_id, "player", player.id)
         db.session.commit()
         return jsonify(player.to_dict()), 201
     except Exception:
@@ -1059,6 +2079,96 @@ def add_player():
         return jsonify({"error": "Failed to add player"}), 500
 
 
+@app.route("/api/players/bulk", methods=["POST"])
+@login_required
+def bulk_add_players():
+    data = request.get_json()
+
+    # Input validation
+    is_valid, error_msg = validate_input_data(data, required_fields=["team_id"])
+    if not is_valid:
+        return jsonify({"error": error_msg}), 400
+
+    team_id = data.get("team_id")
+
+    # Validate team access
+    if not validate_team_access(team_id):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    entries = data.get("players")
+    if not isinstance(entries, list) or not entries:
+        return jsonify({"error": "players must be a non-empty list"}), 400
+
+    # Validate every entry, collecting errors by list index
+    errors = []
+    game_ids = {}
+    for index, entry in enumerate(entries):
+        is_valid, error_msg = validate_input_data(
+            entry if isinstance(entry, dict) else None,
+            required_fields=["name"],
+            max_lengths={"name": 100, "game_id": 50},
+        )
+        if not is_valid:
+            errors.append({"index": index, "error": error_msg})
+            continue
+        game_id = (entry.get("game_id") or "").strip() or None
+        entry["game_id"] = game_id
+        if game_id:
+            if game_id in game_ids:
+                errors.append(
+                    {
+                        "index": index,
+                        "error": f"Game ID is duplicated in this request: {game_id}",
+                    }
+                )
+            game_ids.setdefault(game_id, index)
+
+    # Check every GameID against the team's players in one set-based query
+    if game_ids:
+        existing = db.session.query(Player.game_id, Player.name).filter(
+            Player.team_id == team_id, Player.game_id.in_(game_ids)
+        )
+        for game_id, name in existing:
+            errors.append(
+                {
+                    "index": game_ids[game_id],
+                    "error": f"Game ID is already used by player: {name}",
+                }
+            )
+
+    if errors:
+        errors.sort(key=lambda error: error["index"])
+        return jsonify({"error": "Invalid players", "errors": errors}), 400
+
+    player_rows = [
+        {
+            "name": entry["name"],
+            "game_id": entry["game_id"],
+            "season_id": data.get("season_id"),
+            "team_id": team_id,
+        }
+        for entry in entries
+    ]
+
+    try:
+        # Insert all players in a single multi-row INSERT, collecting their IDs
+        player_ids = (
+            db.session.execute(insert(Player).returning(Player.id), player_rows)
+            .scalars()
+            .all()
+        )
+        bump_team_version(team_id)
+        publish_change(team_id, "player", player_ids)
+        db.session.commit()
+
+        # Reload the committed players in one query rather than one per player
+        players = Player.query.filter(Player.id.in_(player_ids)).order_by(Player.id)
+        return jsonify([player.to_dict() for player in players]), 201
+    except Exception:
+        db.session.rollback()
+        return jsonify({"error": "Failed to add players"}), 500
+
+
 @app.route("/api/players/<int:player_id>", methods=["PUT"])
 @login_required
 def update_player(player_id):
@@ -1091,6 +2201,8 @@ def update_player(player_id):
         player.game_id = new_game_id
 
     try:
+        bump_team_version(player.team_id)
+        publish_change(player.team_id, "player", player.id)
         db.session.commit()
         return jsonify(player.to_dict()), 200
     except Exception:
@@ -1107,8 +2219,34 @@ def delete_player(player_id):
     if not validate_team_access(player.team_id):
         return jsonify({"error": "Access denied to this team"}), 403
 
+    # Battle history is kept; deleting it would change past totals and rankings
+    has_battles = db.session.query(
+        BattleParticipant.query.filter_by(player_id=player_id).exists()
+    ).scalar()
+    if has_battles:
+        return jsonify(
+            {
+                "error": "Cannot delete a player with battle history. Set them inactive instead."
+            }
+        ), 400
+
     try:
-        db.session.delete(player)
+        # Rosters they were on change
+        affected_seasons = [
+            season_id
+            for (season_id,) in db.session.query(SeasonRoster.season_id).filter_by(
+                player_id=player_id
+            )
+        ]
+
+        # Remove the player's roster slots along with the player
+        SeasonRoster.query.filter_by(player_id=player_id).delete(
+            synchronize_session=False
+        )
+        Player.query.filter_by(id=player_id).delete(synchronize_session=False)
+        bump_team_version(player.team_id)
+        publish_change(player.team_id, "player", player_id, "delete")
+        publish_change(player.team_id, "roster", affected_seasons)
         db.session.commit()
         return jsonify({"message": "Player deleted successfully"}), 200
     except Exception:
@@ -1116,9 +2254,158 @@ def delete_player(player_id):
         return jsonify({"error": "Failed to delete player"}), 500
 
 
+def delete_battles_where(*criteria):
+    """Delete matching battles and their participants with subquery DELETEs"""
+    battle_ids = select(Battle.id).where(*criteria)
+    BattleParticipant.query.filter(BattleParticipant.battle_id.in_(battle_ids)).delete(
+        synchronize_session=False
+    )
+    Battle.query.filter(*criteria).delete(synchronize_session=False)
+
+
+def battle_listing_query(team_id, season_id=None):
+    """Query (Battle, total_damage, team_name) rows for a team in one statement"""
+    # Sum damage per battle, restricted to the battles being listed
+    damage = db.session.query(
+        BattleParticipant.battle_id.label("battle_id"),
+        db.func.sum(BattleParticipant.damage_done).label("total_damage"),
+    ).join(Battle)
+    damage = damage.filter(Battle.team_id == team_id)
+    if season_id:
+        damage = damage.filter(Battle.season_id == season_id)
+    damage = damage.group_by(BattleParticipant.battle_id).subquery()
+
+    query = (
+        db.session.query(Battle, db.func.coalesce(damage.c.total_damage, 0), Team.name)
+        .outerjoin(damage, damage.c.battle_id == Battle.id)
+        .outerjoin(Team, Team.id == Battle.team_id)
+        .filter(Battle.team_id == team_id)
+    )
+    if season_id:
+        query = query.filter(Battle.season_id == season_id)
+
+    return query.order_by(Battle.date_created.desc(), Battle.id.desc())
+
+
+def build_participant_rows(participants, team_id, battle_id):
+    """Validate participants against the team with one query and build insert rows"""
+    participants = [p for p in participants if "player_id" in p]
+
+    player_ids = {p["player_id"] for p in participants}
+    team_player_ids = set()
+    if player_ids:
+        team_player_ids = {
+            player_id
+            for (player_id,) in db.session.query(Player.id).filter(
+                Player.id.in_(player_ids), Player.team_id == team_id
+            )
+        }
+
+    # Report the first player (in submission order) that is not on the team
+    for participant_data in participants:
+        if participant_data["player_id"] not in team_player_ids:
+            return None, (
+                f"Player {participant_data['player_id']} does not belong to this team"
+            )
+
+    rows = []
+    for participant_data in participants:
+        try:
+            damage_done = int(participant_data.get("damage_done") or 0)
+            shields_broken = int(participant_data.get("shields_broken") or 0)
+        except (TypeError, ValueError):
+            return None, (
+                f"Invalid damage_done or shields_broken for player "
+                f"{participant_data['player_id']}"
+            )
+        rows.append(
+            {
+                "battle_id": battle_id,
+                "player_id": participant_data["player_id"],
+                "damage_done": damage_done,
+                "shields_broken": shields_broken,
+            }
+        )
+    return rows, None
+
+
+def apply_participant_diff(battle_id, participant_rows):
+    """Update changed, insert new and delete removed participants of a battle
+
+    Returns the per-player (damage, shields, battles) stats deltas of the edit.
+    """
+    existing_by_player = {}
+    for participant in BattleParticipant.query.filter_by(battle_id=battle_id).order_by(
+        BattleParticipant.id
+    ):
+        existing_by_player.setdefault(participant.player_id, []).append(participant)
+
+    updates = []
+    inserts = []
+    deltas = {}
+    for row in participant_rows:
+        matches = existing_by_player.get(row["player_id"])
+        if not matches:
+            inserts.append(row)
+            continue
+
+        participant = matches.pop(0)
+        if (
+            participant.damage_done != row["damage_done"]
+            or participant.shields_broken != row["shields_broken"]
+        ):
+            updates.append(
+                {
+                    "id": participant.id,
+                    "damage_done": row["damage_done"],
+                    "shields_broken": row["shields_broken"],
+                }
+            )
+            damage, shields, battles = deltas.get(row["player_id"], (0, 0, 0))
+            deltas[row["player_id"]] = (
+                damage + row["damage_done"] - participant.damage_done,
+                shields + row["shields_broken"] - participant.shields_broken,
+                battles,
+            )
+
+    # Anything left unmatched was removed from the battle
+    removed = [p for matches in existing_by_player.values() for p in matches]
+    delete_ids = [p.id for p in removed]
+
+    for player_id, (damage, shields, battles) in participant_stats_deltas(
+        inserts
+    ).items():
+        old = deltas.get(player_id, (0, 0, 0))
+        deltas[player_id] = (old[0] + damage, old[1] + shields, old[2] + battles)
+    for player_id, (damage, shields, battles) in participant_stats_deltas(
+        [
+            {
+                "player_id": p.player_id,
+                "damage_done": p.damage_done,
+                "shields_broken": p.shields_broken,
+            }
+            for p in removed
+        ],
+        sign=-1,
+    ).items():
+        old = deltas.get(player_id, (0, 0, 0))
+        deltas[player_id] = (old[0] + damage, old[1] + shields, old[2] + battles)
+
+    if updates:
+        db.session.execute(update(BattleParticipant), updates)
+    if inserts:
+        db.session.execute(insert(BattleParticipant), inserts)
+    if delete_ids:
+        BattleParticipant.query.filter(BattleParticipant.id.in_(delete_ids)).delete(
+            synchronize_session=False
+        )
+    return deltas
+
+
 # Battle endpoints
 @app.route("/api/battles", methods=["GET"])
 @login_required
+@team_etag_cached
 def get_battles():
     season_id = request.args.get("season_id")
     team_id = request.args.get("team_id")
@@ -1131,12 +2418,34 @@ def get_battles():
     if not validate_team_access(int(team_id)):
         return jsonify({"error": "Access denied to this team"}), 403
 
-    query = Battle.query.filter_by(team_id=team_id)
-    if season_id:
-        query = query.filter_by(season_id=season_id)
+    limit, cursor, error_msg = parse_page_args()
+    if error_msg:
+        return jsonify({"error": error_msg}), 400
 
-    battles = query.order_by(Battle.date_created.desc()).all()
-    return jsonify([battle.to_dict() for battle in battles])
+    query = battle_listing_query(team_id, season_id)
+    next_cursor = None
+    if limit is None:
+        rows = query.all()
+    else:
+        try:
+            rows, next_cursor = keyset_page(
+                query,
+                [Battle.date_created, Battle.id],
+                limit,
+                cursor,
+                descending=True,
+                row_key=lambda row: [row[0].date_created, row[0].id],
+            )
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    battles_data = [
+        battle.to_dict(total_damage=total_damage, team_name=team_name)
+        for battle, total_damage, team_name in rows
+    ]
+    if limit is None:
+        return jsonify(battles_data)
+    return jsonify({"items": battles_data, "next_cursor": next_cursor})
 
 
 @app.route("/api/battles", methods=["POST"])
@@ -1192,32 +2501,28 @@ def create_battle():
         team_id=team_id,
     )
 
+    # Validate battle participants belong to the team
+    participant_rows, error_msg = build_participant_rows(
+        data["participants"], team_id, None
+    )
+    if error_msg:
+        return jsonify({"error": error_msg}), 400
+
     try:
         db.session.add(battle)
         db.session.flush()  # Get the battle ID
 
-        # Add battle participants - validate they belong to the team
-        for participant_data in data["participants"]:
-            if "player_id" not in participant_data:
-                continue
-
-            # Validate player belongs to the team
-            player = Player.query.get(participant_data["player_id"])
-            if not player or player.team_id != team_id:
-                return jsonify(
-                    {
-                        "error": f"Player {participant_data['player_id']} does not belong to this team"
-                    }
-                ), 400
-
-            participant = BattleParticipant(
-                battle_id=battle.id,
-                player_id=participant_data["player_id"],
-                damage_done=participant_data.get("damage_done", 0),
-                shields_broken=participant_data.get("shields_broken", 0),
+        # Add battle participants in a single executemany
+        if participant_rows:
+            for row in participant_rows:
+                row["battle_id"] = battle.id
+            db.session.execute(insert(BattleParticipant), participant_rows)
+            apply_stats_deltas(
+                team_id, season_id, participant_stats_deltas(participant_rows)
             )
-            db.session.add(participant)
 
+        bump_team_version(team_id)
+        publish_change(team_id, "battle", battle.id)
         db.session.commit()
         return jsonify(battle.to_dict()), 201
     except Exception:
@@ -1250,6 +2555,15 @@ def update_battle(battle_id):
 
     data = request.get_json()
 
+    # Validate updated participants belong to the team
+    participant_rows = None
+    if "participants" in data:
+        participant_rows, error_msg = build_participant_rows(
+            data["participants"], battle.team_id, battle_id
+        )
+        if error_msg:
+            return jsonify({"error": error_msg}), 400
+
     # Update battle details
     if "enemy_name" in data:
         battle.enemy_name = data["enemy_name"]
@@ -1262,32 +2576,13 @@ def update_battle(battle_id):
 
     try:
         # Update participants if provided
-        if "participants" in data:
-            # Delete existing participants
-            BattleParticipant.query.filter_by(battle_id=battle_id).delete()
-
-            # Add updated participants - validate they belong to the team
-            for participant_data in data["participants"]:
-                if "player_id" not in participant_data:
-                    continue
-
-                # Validate player belongs to the team
-                player = Player.query.get(participant_data["player_id"])
-                if not player or player.team_id != battle.team_id:
-                    return jsonify(
-                        {
-                            "error": f"Player {participant_data['player_id']} does not belong to this team"
-                        }
-                    ), 400
-
-                participant = BattleParticipant(
-                    battle_id=battle_id,
-                    player_id=participant_data["player_id"],
-                    damage_done=participant_data.get("damage_done", 0),
-                    shields_broken=participant_data.get("shields_broken", 0),
-                )
-                db.session.add(participant)
+        if participant_rows is not None:
+            # Only touch participant rows that actually changed
+            deltas = apply_participant_diff(battle_id, participant_rows)
+            apply_stats_deltas(battle.team_id, battle.season_id, deltas)
 
+        bump_team_version(battle.team_id)
+        publish_change(battle.team_id, "battle", battle.id)
         db.session.commit()
 
         # Return complete battle data including participants
@@ -1309,8 +2604,30 @@ def delete_battle(battle_id):
         return jsonify({"error": "Access denied to this team"}), 403
 
     try:
+        # Take the battle's contribution out of the player season stats
+        removed = (
+            db.session.query(
+                BattleParticipant.player_id,
+                db.func.sum(BattleParticipant.damage_done),
+                db.func.sum(BattleParticipant.shields_broken),
+                db.func.count(BattleParticipant.id),
+            )
+            .filter_by(battle_id=battle_id)
+            .group_by(BattleParticipant.player_id)
+        )
+        apply_stats_deltas(
+            battle.team_id,
+            battle.season_id,
+            {
+                player_id: (-damage, -shields, -battles)
+                for player_id, damage, shields, battles in removed
+            },
+        )
+
         # Delete participants first (due to foreign key constraint)
         BattleParticipant.query.filter_by(battle_id=battle_id).delete()
+        bump_team_version(battle.team_id)
+        publish_change(battle.team_id, "battle", battle_id, "delete")
         db.session.delete(battle)
         db.session.commit()
         return jsonify({"message": "Battle deleted successfully"}), 200
@@ -1319,8 +2636,14 @@ def delete_battle(battle_id):
         return jsonify({"error": "Failed to delete battle"}), 500
 
 
+def player_team_id(player_id):
+    """Team of a player, for caching player-scoped reads"""
+    return db.session.query(Player.team_id).filter_by(id=player_id).scalar()
+
+
 @app.route("/api/players/<int:player_id>/battle-stats", methods=["GET"])
 @login_required
+@team_etag_cached(team_id_for=player_team_id)
 def get_player_battle_stats(player_id):
     player = Player.query.get_or_404(player_id)
 
@@ -1330,26 +2653,20 @@ def get_player_battle_stats(player_id):
 
     season_id = request.args.get("season_id")
 
-    # Base query for battle participants - only include battles from the same team
-    query = (
-        db.session.query(BattleParticipant)
-        .filter_by(player_id=player_id)
-        .join(Battle)
-        .filter(Battle.team_id == player.team_id)
+    # Read the materialized totals - only battles from the player's team count
+    query = PlayerSeasonStats.query.filter_by(
+        team_id=player.team_id, player_id=player_id
     )
 
     # Filter by season if specified
     if season_id:
-        query = query.filter(Battle.season_id == season_id)
+        query = query.filter_by(season_id=season_id)
 
-    # Get total stats
-    total_damage = (
-        query.with_entities(db.func.sum(BattleParticipant.damage_done)).scalar() or 0
-    )
-    total_shields = (
-        query.with_entities(db.func.sum(BattleParticipant.shields_broken)).scalar() or 0
-    )
-    battle_count = query.count()
+    total_damage, total_shields, battle_count = query.with_entities(
+        db.func.coalesce(db.func.sum(PlayerSeasonStats.total_damage), 0),
+        db.func.coalesce(db.func.sum(PlayerSeasonStats.total_shields_broken), 0),
+        db.func.coalesce(db.func.sum(PlayerSeasonStats.battle_count), 0),
+    ).one()
 
     return jsonify(
         {
@@ -1362,20 +2679,95 @@ def get_player_battle_stats(player_id):
     )
 
 
+@app.route("/api/players/roster/battle-stats", methods=["GET"])
+@login_required
+@team_etag_cached
+def get_roster_battle_stats():
+    season_id = request.args.get("season_id")
+    team_id = request.args.get("team_id")
+
+    # Require team_id and season_id for roster stats
+    if not team_id:
+        return jsonify({"error": "Team ID is required"}), 400
+    if not season_id:
+        return jsonify({"error": "Season ID is required"}), 400
+
+    # Validate team access
+    if not validate_team_access(int(team_id)):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    return jsonify(roster_battle_stats(season_id, team_id))
+
+
+def roster_battle_stats(season_id, team_id):
+    """Serialize season battle totals for every active roster player"""
+    # Join the materialized season totals onto the roster so every slot is returned
+    rows = (
+        db.session.query(
+            Player.id,
+            Player.name,
+            db.func.coalesce(PlayerSeasonStats.total_damage, 0),
+            db.func.coalesce(PlayerSeasonStats.total_shields_broken, 0),
+            db.func.coalesce(PlayerSeasonStats.battle_count, 0),
+        )
+        .join(SeasonRoster, SeasonRoster.player_id == Player.id)
+        .outerjoin(
+            PlayerSeasonStats,
+            (PlayerSeasonStats.team_id == Player.team_id)
+            & (PlayerSeasonStats.season_id == SeasonRoster.season_id)
+            & (PlayerSeasonStats.player_id == Player.id),
+        )
+        .filter(
+            SeasonRoster.season_id == season_id,
+            Player.status == "active",
+            Player.team_id == team_id,
+        )
+        .order_by(SeasonRoster.roster_position)
+        .all()
+    )
+
+    return [
+        {
+            "player_id": player_id,
+            "player_name": player_name,
+            "total_damage": total_damage,
+            "total_shields_broken": total_shields,
+            "battles_participated": battle_count,
+        }
+        for player_id, player_name, total_damage, total_shields, battle_count in rows
+    ]
+
+
 # Season endpoints
 @app.route("/api/seasons", methods=["GET"])
 @login_required
+@team_etag_cached
 def get_seasons():
     team_id = request.args.get("team_id")
+    limit, cursor, error_msg = parse_page_args()
+    if error_msg:
+        return jsonify({"error": error_msg}), 400
+
+    query = Season.query
     if team_id:
-        seasons = (
-            Season.query.filter_by(team_id=team_id)
-            .order_by(Season.date_created.desc())
-            .all()
+        query = query.filter_by(team_id=team_id)
+
+    if limit is None:
+        seasons = query.order_by(Season.date_created.desc()).all()
+        return jsonify([season.to_dict() for season in seasons])
+
+    try:
+        seasons, next_cursor = keyset_page(
+            query, [Season.date_created, Season.id], limit, cursor, descending=True
         )
-    else:
-        seasons = Season.query.order_by(Season.date_created.desc()).all()
-    return jsonify([season.to_dict() for season in seasons])
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    return jsonify(
+        {
+            "items": [season.to_dict() for season in seasons],
+            "next_cursor": next_cursor,
+        }
+    )
 
 
 @app.route("/api/seasons", methods=["POST"])
@@ -1390,6 +2782,9 @@ def create_season():
 
     try:
         db.session.add(season)
+        db.session.flush()  # Get the season ID
+        bump_team_version(season.team_id)
+        publish_change(season.team_id, "season", season.id)
         db.session.commit()
         return jsonify(season.to_dict()), 201
     except Exception:
@@ -1408,6 +2803,8 @@ def update_season(season_id):
 
     try:
         season.name = data["name"]
+        bump_team_version(season.team_id)
+        publish_change(season.team_id, "season", season.id)
         db.session.commit()
         return jsonify(season.to_dict()), 200
     except Exception as e:
@@ -1423,24 +2820,42 @@ def delete_season(season_id):
     try:
         # Delete in proper order to avoid foreign key constraint issues
 
-        # 1. Delete battle participants for battles in this season
-        battle_ids = [b.id for b in Battle.query.filter_by(season_id=season_id).all()]
-        if battle_ids:
-            BattleParticipant.query.filter(
-                BattleParticipant.battle_id.in_(battle_ids)
-            ).delete()
+        # Record what goes away or changes with the season for live clients
+        season_battles = [
+            battle_id
+            for (battle_id,) in db.session.query(Battle.id).filter_by(
+                season_id=season_id
+            )
+        ]
+        season_players = [
+            player_id
+            for (player_id,) in db.session.query(Player.id).filter_by(
+                season_id=season_id
+            )
+        ]
 
-        # 2. Delete battles for this season
-        Battle.query.filter_by(season_id=season_id).delete()
+        # 1. Delete battles for this season, their participants and stats
+        delete_battles_where(Battle.season_id == season_id)
+        PlayerSeasonStats.query.filter_by(season_id=season_id).delete(
+            synchronize_session=False
+        )
 
-        # 3. Delete season roster entries
-        SeasonRoster.query.filter_by(season_id=season_id).delete()
+        # 2. Delete season roster entries
+        SeasonRoster.query.filter_by(season_id=season_id).delete(
+            synchronize_session=False
+        )
 
-        # 4. Update players to remove season association (but don't delete players)
-        Player.query.filter_by(season_id=season_id).update({"season_id": None})
+        # 3. Update players to remove season association (but don't delete players)
+        Player.query.filter_by(season_id=season_id).update(
+            {"season_id": None}, synchronize_session=False
+        )
 
-        # 5. Finally delete the season itself
-        db.session.delete(season)
+        # 4. Finally delete the season itself
+        Season.query.filter_by(id=season_id).delete(synchronize_session=False)
+        bump_team_version(season.team_id)
+        publish_change(season.team_id, "battle", season_battles, "delete")
+        publish_change(season.team_id, "player", season_players)
+        publish_change(season.team_id, "season", season_id, "delete")
         db.session.commit()
         return jsonify({"message": "Season deleted successfully"}), 200
     except Exception as e:
@@ -1459,8 +2874,932 @@ def get_current_season():
         return jsonify({"error": "No seasons found"}), 404
 
 
-def run_migrations():
-    """Database migration system for SQLite"""
+LEADERBOARD_DEFAULT_LIMIT = 10
+
+
+@app.route("/api/seasons/<int:season_id>/leaderboard", methods=["GET"])
+@login_required
+def get_season_leaderboard(season_id):
+    season = Season.query.get_or_404(season_id)
+
+    # Validate team access
+    if not validate_team_access(season.team_id):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    limit = request.args.get("limit", LEADERBOARD_DEFAULT_LIMIT, type=int)
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"}), 400
+
+    metrics = {
+        "damage": PlayerSeasonStats.total_damage,
+        "shields": PlayerSeasonStats.total_shields_broken,
+        "battles": PlayerSeasonStats.battle_count,
+        "avg_damage": PlayerSeasonStats.total_damage
+        * 1.0
+        / PlayerSeasonStats.battle_count,
+    }
+    sort = request.args.get("sort", "damage")
+    if sort not in metrics:
+        return jsonify({"error": f"sort must be one of: {', '.join(metrics)}"}), 400
+
+    # Rank every metric with window functions over the season's stats rows
+    windows = []
+    for name, column in metrics.items():
+        windows.append(
+            db.func.rank().over(order_by=column.desc()).label(f"{name}_rank")
+        )
+        windows.append(
+            db.func.percent_rank().over(order_by=column).label(f"{name}_percentile")
+        )
+    ranked = (
+        select(
+            Player.id.label("player_id"),
+            Player.name.label("player_name"),
+            PlayerSeasonStats.total_damage,
+            PlayerSeasonStats.total_shields_broken,
+            PlayerSeasonStats.battle_count,
+            metrics["avg_damage"].label("avg_damage"),
+            *windows,
+        )
+        .join(Player, Player.id == PlayerSeasonStats.player_id)
+        .where(
+            PlayerSeasonStats.team_id == season.team_id,
+            PlayerSeasonStats.season_id == season_id,
+        )
+        .subquery()
+    )
+    rows = db.session.execute(
+        select(ranked)
+        .order_by(ranked.c[f"{sort}_rank"], ranked.c.player_name)
+        .limit(limit)
+    ).mappings()
+
+    return jsonify(
+        {
+            "season_id": season_id,
+            "sort": sort,
+            "players": [
+                {
+                    "player_id": row["player_id"],
+                    "player_name": row["player_name"],
+                    "total_damage": row["total_damage"],
+                    "total_shields_broken": row["total_shields_broken"],
+                    "battles_participated": row["battle_count"],
+                    "avg_damage": round(row["avg_damage"], 2),
+                    **{f"{name}_rank": row[f"{name}_rank"] for name in metrics},
+                    **{
+                        f"{name}_percentile": round(float(row[f"{name}_percentile"]), 4)
+                        for name in metrics
+                    },
+                }
+                for row in rows
+            ],
+        }
+    )
+
+
+ANALYTICS_QUANTILES = {"min": 0.0, "p25": 0.25, "median": 0.5, "p75": 0.75, "max": 1.0}
+ANALYTICS_MAX_BUCKETS = 20
+
+
+@app.route("/api/seasons/<int:season_id>/analytics", methods=["GET"])
+@login_required
+def get_season_analytics(season_id):
+    season = Season.query.get_or_404(season_id)
+
+    # Validate team access
+    if not validate_team_access(season.team_id):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    buckets = request.args.get("buckets", 4, type=int)
+    if buckets < 1 or buckets > ANALYTICS_MAX_BUCKETS:
+        return jsonify(
+            {"error": f"buckets must be between 1 and {ANALYTICS_MAX_BUCKETS}"}
+        ), 400
+
+    # Pull every battle/participant column for the season in one bulk fetch,
+    # ordered so each battle's rows are contiguous and battles run oldest first
+    # (plain Core execution; dates stay raw strings and only one per battle is
+    # parsed)
+    rows = (
+        db.session.connection()
+        .execute(
+            select(
+                Battle.id,
+                Battle.our_score,
+                Battle.their_score,
+                Battle.enemy_power_ranking,
+                db.cast(Battle.date_created, db.String),
+                db.func.coalesce(BattleParticipant.player_id, 0),
+                db.func.coalesce(BattleParticipant.damage_done, 0),
+            )
+            .outerjoin(BattleParticipant, BattleParticipant.battle_id == Battle.id)
+            .where(Battle.team_id == season.team_id, Battle.season_id == season_id)
+            .order_by(Battle.date_created, Battle.id)
+        )
+        .all()
+    )
+
+    if not rows:
+        return jsonify(
+            {
+                "season_id": season_id,
+                "battles": 0,
+                "record": {"wins": 0, "losses": 0, "draws": 0, "win_rate": 0.0},
+                "damage_trend": {"slope": 0.0, "battles": []},
+                "players": [],
+                "power_buckets": [],
+            }
+        )
+
+    columns = list(zip(*rows))
+    row_battle_ids = np.array(columns[0], dtype=np.int64)
+    row_player_ids = np.array(columns[5], dtype=np.int64)
+    row_damage = np.array(columns[6], dtype=np.float64)
+
+    # Battle-level arrays: one entry per battle, taken from its first row
+    new_battle = np.r_[True, row_battle_ids[1:] != row_battle_ids[:-1]]
+    battle_starts = np.flatnonzero(new_battle)
+    row_battle_pos = np.cumsum(new_battle) - 1
+    battle_ids = row_battle_ids[battle_starts]
+    our_scores = np.array(columns[1], dtype=np.int64)[battle_starts]
+    their_scores = np.array(columns[2], dtype=np.int64)[battle_starts]
+    power = np.array(columns[3], dtype=np.float64)[battle_starts]
+    battle_count = len(battle_ids)
+
+    # Win/loss record
+    wins = our_scores > their_scores
+    losses = our_scores < their_scores
+    win_count = int(wins.sum())
+    loss_count = int(losses.sum())
+
+    # Per-battle damage trend with a least-squares slope over battle order
+    battle_damage = np.bincount(
+        row_battle_pos, weights=row_damage, minlength=battle_count
+    )
+    slope = 0.0
+    if battle_count > 1:
+        slope = float(np.polyfit(np.arange(battle_count), battle_damage, 1)[0])
+    results = np.where(wins, "win", np.where(losses, "loss", "draw"))
+
+    # Per-player damage quantiles: sort by (player, damage) and interpolate
+    # within each player's contiguous run
+    participant_mask = row_player_ids > 0
+    player_ids = row_player_ids[participant_mask]
+    damage = row_damage[participant_mask]
+    order = np.lexsort((damage, player_ids))
+    player_ids, damage = player_ids[order], damage[order]
+    players = []
+    if len(player_ids):
+        unique_ids, starts, counts = np.unique(
+            player_ids, return_index=True, return_counts=True
+        )
+        names = dict(
+            db.session.query(Player.id, Player.name).filter(
+                Player.id.in_(unique_ids.tolist())
+            )
+        )
+        positions = starts[:, None] + np.array(list(ANALYTICS_QUANTILES.values())) * (
+            counts[:, None] - 1
+        )
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.ceil(positions).astype(np.int64)
+        quantiles = damage[lower] + (damage[upper] - damage[lower]) * (
+            positions - lower
+        )
+        averages = np.add.reduceat(damage, starts) / counts
+        players = [
+            {
+                "player_id": int(player_id),
+                "player_name": names.get(int(player_id)),
+                "battles": int(count),
+                "avg_damage": round(float(average), 2),
+                "damage_quantiles": dict(
+                    zip(ANALYTICS_QUANTILES, np.round(row, 2).tolist())
+                ),
+            }
+            for player_id, count, average, row in zip(
+                unique_ids, counts, averages, quantiles
+            )
+        ]
+        players.sort(key=lambda player: player["avg_damage"], reverse=True)
+
+    # Performance against enemy power ranking, bucketed by quantile edges
+    edges = np.unique(np.quantile(power, np.linspace(0, 1, buckets + 1)))
+    if len(edges) < 2:
+        edges = np.array([edges[0], edges[0]])
+    bucket_index = np.clip(
+        np.searchsorted(edges, power, side="right") - 1, 0, len(edges) - 2
+    )
+    bucket_battles = np.bincount(bucket_index, minlength=len(edges) - 1)
+    bucket_wins = np.bincount(bucket_index, weights=wins, minlength=len(edges) - 1)
+    bucket_damage = np.bincount(
+        bucket_index, weights=battle_damage, minlength=len(edges) - 1
+    )
+    power_buckets = [
+        {
+            "min_power": float(edges[i]),
+            "max_power": float(edges[i + 1]),
+            "battles": int(bucket_battles[i]),
+            "wins": int(bucket_wins[i]),
+            "win_rate": round(float(bucket_wins[i] / bucket_battles[i]), 4),
+            "avg_damage": round(float(bucket_damage[i] / bucket_battles[i]), 2),
+        }
+        for i in range(len(edges) - 1)
+        if bucket_battles[i]
+    ]
+
+    return jsonify(
+        {
+            "season_id": season_id,
+            "battles": battle_count,
+            "record": {
+                "wins": win_count,
+                "losses": loss_count,
+                "draws": battle_count - win_count - loss_count,
+                "win_rate": round(win_count / battle_count, 4),
+            },
+            "damage_trend": {
+                "slope": round(slope, 4),
+                "battles": [
+                    {
+                        "battle_id": int(battle_id),
+                        "date_created": datetime.fromisoformat(
+                            columns[4][start]
+                        ).isoformat(),
+                        "total_damage": int(total),
+                        "result": str(result),
+                    }
+                    for battle_id, start, total, result in zip(
+                        battle_ids, battle_starts, battle_damage, results
+                    )
+                ],
+            },
+            "players": players,
+            "power_buckets": power_buckets,
+        }
+    )
+
+
+# Live update endpoints: clients poll the delta endpoint with the last
+# sequence they applied, so no request outlives the sync worker timeout
+def change_log_head(team_id):
+    """Latest change sequence number of a team, 0 when it has none
+
+    A pruned team keeps its "pruned" marker, so the head never falls behind
+    the point its log was pruned to.
+    """
+    return (
+        db.session.query(db.func.max(ChangeLog.id)).filter_by(team_id=team_id).scalar()
+        or 0
+    )
+
+
+def change_payloads(team_id, changes):
+    """Serialize the current state of changed entities, one query per entity type
+
+    Returns {(entity, entity_id): payload}; deleted entities have no entry.
+    """
+    ids_by_entity = {}
+    for change in changes:
+        if change.action != "delete":
+            ids_by_entity.setdefault(change.entity, set()).add(change.entity_id)
+
+    payloads = {}
+    if "battle" in ids_by_entity:
+        rows = battle_listing_query(team_id).filter(
+            Battle.id.in_(ids_by_entity["battle"])
+        )
+        for battle, total_damage, team_name in rows:
+            payloads[("battle", battle.id)] = battle.to_dict(
+                total_damage=total_damage, team_name=team_name
+            )
+    if "player" in ids_by_entity:
+        players = Player.query.filter(
+            Player.id.in_(ids_by_entity["player"]), Player.team_id == team_id
+        )
+        for player in players:
+            payloads[("player", player.id)] = player.to_dict()
+    if "season" in ids_by_entity:
+        seasons = Season.query.filter(
+            Season.id.in_(ids_by_entity["season"]), Season.team_id == team_id
+        )
+        for season in seasons:
+            payloads[("season", season.id)] = season.to_dict()
+    for season_id in ids_by_entity.get("roster", ()):
+        payloads[("roster", season_id)] = season_roster_data(season_id, team_id)
+    if "team" in ids_by_entity:
+        team = Team.query.get(team_id)
+        if team:
+            payloads[("team", team.id)] = team.to_dict()
+    return payloads
+
+
+DELTA_MAX_CHANGES = 1000
+# Clients poll this endpoint for live updates, well above the default limits
+CHANGES_RATE_LIMIT = os.getenv("CHANGES_RATE_LIMIT", "30 per minute")
+
+
+@app.route("/api/teams/<int:team_id>/changes", methods=["GET"])
+@login_required
+@limiter.limit(CHANGES_RATE_LIMIT)
+def get_team_changes(team_id):
+    """Rows inserted, updated or deleted since a change sequence number
+
+    The change log id is the team's update sequence; delete entries are the
+    tombstones. Without since, or when since predates the pruned part of the
+    log, a full snapshot is returned to seed a client cache.
+    """
+    # Validate team access
+    if not validate_team_access(team_id):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    since = request.args.get("since", type=int)
+    if since is not None and since < 0:
+        return jsonify({"error": "since must be a non-negative sequence"}), 400
+
+    # The team's entries up to its "pruned" marker, tombstones included, are gone
+    pruned_to = (
+        db.session.query(db.func.max(ChangeLog.id))
+        .filter_by(team_id=team_id, entity="pruned")
+        .scalar()
+    )
+    full = since is None or (pruned_to is not None and since < pruned_to)
+
+    data = {
+        "team_id": team_id,
+        "since": since,
+        "seq": change_log_head(team_id),
+        "full": full,
+        "has_more": False,
+        "team": None,
+        "players": [],
+        "battles": [],
+        "seasons": [],
+        "rosters": {},
+        "deleted": {"players": [], "battles": [], "seasons": []},
+    }
+
+    if full:
+        team = Team.query.get(team_id)
+        data["team"] = team.to_dict() if team else None
+        data["players"] = [
+            player.to_dict() for player in Player.query.filter_by(team_id=team_id)
+        ]
+        data["battles"] = [
+            battle.to_dict(total_damage=total_damage, team_name=team_name)
+            for battle, total_damage, team_name in battle_listing_query(team_id)
+        ]
+        seasons = Season.query.filter_by(team_id=team_id).order_by(
+            Season.date_created.desc()
+        )
+        data["seasons"] = [season.to_dict() for season in seasons]
+        data["rosters"] = {season["id"]: [] for season in data["seasons"]}
+
+        # Every season's roster in one query, grouped per season
+        season_rosters = (
+            SeasonRoster.query.join(Season, Season.id == SeasonRoster.season_id)
+            .join(Player, Player.id == SeasonRoster.player_id)
+            .options(contains_eager(SeasonRoster.player))
+            .filter(
+                Season.team_id == team_id,
+                Player.status == "active",
+                Player.team_id == team_id,
+            )
+            .order_by(SeasonRoster.season_id, SeasonRoster.roster_position)
+        )
+        for sr in season_rosters:
+            player_data = sr.player.to_dict()
+            player_data["roster_position"] = sr.roster_position
+            data["rosters"][sr.season_id].append(player_data)
+        return jsonify(data)
+
+    changes = (
+        ChangeLog.query.filter(ChangeLog.team_id == team_id, ChangeLog.id > since)
+        .order_by(ChangeLog.id)
+        .limit(DELTA_MAX_CHANGES + 1)
+        .all()
+    )
+    if len(changes) > DELTA_MAX_CHANGES:
+        changes = changes[:DELTA_MAX_CHANGES]
+        data["seq"] = changes[-1].id
+        data["has_more"] = True
+
+    # Only the latest change per row matters
+    latest = {}
+    for change in changes:
+        latest[(change.entity, change.entity_id)] = change
+    payloads = change_payloads(team_id, latest.values())
+
+    collections = {"player": "players", "battle": "battles", "season": "seasons"}
+    for (entity, entity_id), change in latest.items():
+        payload = payloads.get((entity, entity_id))
+        if entity == "roster":
+            if payload is not None:
+                data["rosters"][entity_id] = payload
+        elif entity == "team":
+            data["team"] = payload
+        elif entity in collections:
+            if payload is None:
+                data["deleted"][collections[entity]].append(entity_id)
+            else:
+                data[collections[entity]].append({**payload, "seq": change.id})
+    return jsonify(data)
+
+
+# Bootstrap endpoint
+BOOTSTRAP_BATTLE_LIMIT = 50
+
+
+@app.route("/api/bootstrap", methods=["GET"])
+def bootstrap():
+    """Everything the SPA needs to render a team/season in one response"""
+    if not current_user.is_authenticated:
+        return jsonify({"authenticated": False, "user": None})
+
+    teams = get_user_teams()
+    if isinstance(current_user, User):
+        user_dict = current_user.to_dict(teams=teams)
+    else:
+        user_dict = current_user.to_dict()
+    user_dict["is_superadmin"] = is_superadmin()
+    member_counts = team_member_counts(teams)
+    data = {
+        "authenticated": True,
+        "user": user_dict,
+        "teams": [
+            team.to_dict(member_count=member_counts.get(team.id, 0)) for team in teams
+        ],
+        "current_team": None,
+        "seasons": [],
+        "current_season": None,
+        "players": [],
+        "roster": [],
+        "battles": {"items": [], "next_cursor": None},
+        "roster_stats": [],
+        "seq": 0,
+    }
+
+    # Superusers only use the admin panel, which loads its own data
+    if user_dict["is_superadmin"]:
+        return jsonify(data)
+
+    # Default to the user's first team
+    team_id = request.args.get("team_id", type=int)
+    if team_id:
+        if not validate_team_access(team_id):
+            return jsonify({"error": "Access denied to this team"}), 403
+        # Access may come from a cached principal that predates a removal
+        team = next((team for team in teams if team.id == team_id), None)
+        if team is None:
+            return jsonify({"error": "Access denied to this team"}), 403
+    else:
+        team = teams[0] if teams else None
+    if team is None:
+        return jsonify(data)
+    data["current_team"] = team.to_dict(member_count=member_counts.get(team.id, 0))
+    # Live updates resume polling the delta endpoint from here
+    data["seq"] = change_log_head(team.id)
+
+    # Default to the team's newest season
+    seasons = (
+        Season.query.filter_by(team_id=team.id)
+        .order_by(Season.date_created.desc())
+        .all()
+    )
+    data["seasons"] = [season.to_dict() for season in seasons]
+    season_id = request.args.get("season_id", type=int)
+    if season_id:
+        season = next((season for season in seasons if season.id == season_id), None)
+        if season is None:
+            return jsonify({"error": "Season does not belong to this team"}), 400
+    else:
+        season = seasons[0] if seasons else None
+
+    players = Player.query.filter_by(team_id=team.id, status="active").all()
+    data["players"] = [player.to_dict() for player in players]
+    if season is None:
+        return jsonify(data)
+    data["current_season"] = season.to_dict()
+
+    data["roster"] = season_roster_data(season.id, team.id)
+    data["roster_stats"] = roster_battle_stats(season.id, team.id)
+
+    rows, next_cursor = keyset_page(
+        battle_listing_query(team.id, season.id),
+        [Battle.date_created, Battle.id],
+        BOOTSTRAP_BATTLE_LIMIT,
+        None,
+        descending=True,
+        row_key=lambda row: [row[0].date_created, row[0].id],
+    )
+    data["battles"] = {
+        "items": [
+            battle.to_dict(total_damage=total_damage, team_name=team_name)
+            for battle, total_damage, team_name in rows
+        ],
+        "next_cursor": next_cursor,
+    }
+    return jsonify(data)
+
+
+# Import/export endpoints
+# Column layout shared by the CSV and NDJSON battle history formats
+BATTLE_EXPORT_COLUMNS = [
+    "battle_id",
+    "date_created",
+    "season_id",
+    "season_name",
+    "enemy_name",
+    "enemy_power_ranking",
+    "our_score",
+    "their_score",
+    "player_id",
+    "player_name",
+    "player_game_id",
+    "damage_done",
+    "shields_broken",
+]
+EXPORT_BATCH_SIZE = 500
+
+
+@app.route("/api/teams/<int:team_id>/export", methods=["GET"])
+@login_required
+def export_team_battles(team_id):
+    # Validate team access
+    if not validate_team_access(team_id):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    export_format = request.args.get("format", "csv")
+    if export_format not in ("csv", "ndjson"):
+        return jsonify({"error": "format must be csv or ndjson"}), 400
+
+    # One row per participant; battles without participants still get a row
+    query = (
+        select(
+            Battle.id,
+            Battle.date_created,
+            Battle.season_id,
+            Season.name,
+            Battle.enemy_name,
+            Battle.enemy_power_ranking,
+            Battle.our_score,
+            Battle.their_score,
+            BattleParticipant.player_id,
+            Player.name,
+            Player.game_id,
+            BattleParticipant.damage_done,
+            BattleParticipant.shields_broken,
+        )
+        .outerjoin(Season, Season.id == Battle.season_id)
+        .outerjoin(BattleParticipant, BattleParticipant.battle_id == Battle.id)
+        .outerjoin(Player, Player.id == BattleParticipant.player_id)
+        .where(Battle.team_id == team_id)
+        .order_by(Battle.date_created, Battle.id, BattleParticipant.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    season_id = request.args.get("season_id")
+    if season_id:
+        query = query.where(Battle.season_id == season_id)
+
+    def generate():
+        # Stream from a server-side cursor, one flushed chunk per batch
+        result = db.session.execute(query)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == "csv":
+            writer.writerow(BATTLE_EXPORT_COLUMNS)
+        for batch in result.partitions():
+            for row in batch:
+                values = list(row)
+                values[1] = values[1].isoformat()
+                if export_format == "csv":
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(BATTLE_EXPORT_COLUMNS, values))))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    mimetype = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    response = app.response_class(stream_with_context(generate()), mimetype=mimetype)
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename=team-{team_id}-battles.{export_format}"
+    )
+    return response
+
+
+IMPORT_CHUNK_SIZE = 500
+# Columns identifying a battle when rows carry no battle_id
+IMPORT_GROUP_COLUMNS = [
+    "date_created",
+    "season_id",
+    "season_name",
+    "enemy_name",
+    "enemy_power_ranking",
+    "our_score",
+    "their_score",
+]
+
+
+def read_import_records(import_format):
+    """Yield (line number, record dict or error message) from the uploaded file"""
+    upload = request.files.get("file")
+    data = upload.read() if upload else request.get_data()
+    lines = data.decode("utf-8-sig").splitlines()
+
+    if import_format == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Each line must be a JSON object"
+            continue
+        yield line_number, record
+
+
+def import_int(record, field, default=None):
+    """Read an integer field from an import record, raising ValueError if invalid"""
+    value = record.get(field)
+    if value is None or value == "":
+        if default is None:
+            raise ValueError(f"{field} is required")
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be a valid number")
+
+
+@app.route("/api/teams/<int:team_id>/import", methods=["POST"])
+@login_required
+def import_team_battles(team_id):
+    # Validate team access
+    if not validate_team_access(team_id):
+        return jsonify({"error": "Access denied to this team"}), 403
+
+    import_format = request.args.get("format", "csv")
+    if import_format not in ("csv", "ndjson"):
+        return jsonify({"error": "format must be csv or ndjson"}), 400
+
+    default_season_id = request.args.get("season_id", type=int)
+
+    # Lookup maps for the team's seasons and players, built once
+    seasons_by_id = {}
+    seasons_by_name = {}
+    for season_id, season_name in db.session.query(Season.id, Season.name).filter_by(
+        team_id=team_id
+    ):
+        seasons_by_id[season_id] = season_id
+        seasons_by_name[season_name] = season_id
+    if default_season_id and default_season_id not in seasons_by_id:
+        return jsonify({"error": "Season does not belong to this team"}), 400
+
+    players_by_game_id = {}
+    players_by_name = {}
+    for player_id, player_name, game_id in db.session.query(
+        Player.id, Player.name, Player.game_id
+    ).filter_by(team_id=team_id):
+        if game_id:
+            players_by_game_id[game_id] = player_id
+        # Names shared by several players can't be resolved by name
+        players_by_name[player_name] = (
+            None if player_name in players_by_name else player_id
+        )
+
+    # Group rows into battles: rows sharing a battle_id belong to one battle,
+    # rows without one are grouped by their battle columns, which must then
+    # include date_created to tell separate battles apart
+    battles = {}
+    errors = []
+    failed_keys = set()
+    imported_at = datetime.now(timezone.utc)
+    for line_number, record in read_import_records(import_format):
+        if isinstance(record, str):
+            errors.append({"row": line_number, "error": record})
+            continue
+
+        # The key comes from the raw columns so failed rows still mark their battle
+        if record.get("battle_id") not in (None, ""):
+            key = ("id", str(record["battle_id"]))
+        elif record.get("date_created"):
+            key = tuple(
+                str(record.get(column) or "").strip() for column in IMPORT_GROUP_COLUMNS
+            )
+        else:
+            errors.append(
+                {
+                    "row": line_number,
+                    "error": "battle_id or date_created is required",
+                }
+            )
+            continue
+
+        try:
+            enemy_name = (record.get("enemy_name") or "").strip()
+            if not enemy_name:
+                raise ValueError("enemy_name is required")
+            if len(enemy_name) > 100:
+                raise ValueError("enemy_name must be 100 characters or less")
+
+            season_ref = record.get("season_id")
+            if season_ref not in (None, ""):
+                season_id = seasons_by_id.get(import_int(record, "season_id"))
+            elif record.get("season_name"):
+                season_id = seasons_by_name.get(record["season_name"])
+            else:
+                season_id = default_season_id
+            if season_id is None and (season_ref or record.get("season_name")):
+                raise ValueError("Season not found for this team")
+
+            date_created = imported_at
+            if record.get("date_created"):
+                try:
+                    date_created = datetime.fromisoformat(record["date_created"])
+                except (TypeError, ValueError):
+                    raise ValueError("date_created must be an ISO 8601 timestamp")
+
+            battle = {
+                "enemy_name": enemy_name,
+                "enemy_power_ranking": import_int(record, "enemy_power_ranking"),
+                "our_score": import_int(record, "our_score"),
+                "their_score": import_int(record, "their_score"),
+                "season_id": season_id,
+                "team_id": team_id,
+                "date_created": date_created,
+            }
+
+            participant = None
+            game_id = record.get("player_game_id")
+            player_name = record.get("player_name")
+            if game_id or player_name:
+                player_id = (
+                    players_by_game_id.get(str(game_id))
+                    if game_id
+                    else players_by_name.get(player_name)
+                )
+                if player_id is None:
+                    raise ValueError(
+                        f"Player {game_id or player_name} not found on this team"
+                    )
+                participant = {
+                    "player_id": player_id,
+                    "damage_done": import_int(record, "damage_done", 0),
+                    "shields_broken": import_int(record, "shields_broken", 0),
+                }
+        except ValueError as e:
+            errors.append({"row": line_number, "error": str(e)})
+            failed_keys.add(key)
+            continue
+
+        entry = battles.setdefault(key, {"battle": battle, "participants": []})
+        if participant:
+            entry["participants"].append(participant)
+
+    # A battle with any invalid row is skipped as a whole
+    for key in failed_keys:
+        battles.pop(key, None)
+
+    # Insert battles and participants in chunked executemany transactions
+    entries = list(battles.values())
+    battles_imported = 0
+    participants_imported = 0
+    for start in range(0, len(entries), IMPORT_CHUNK_SIZE):
+        chunk = entries[start : start + IMPORT_CHUNK_SIZE]
+        try:
+            battle_ids = (
+                db.session.execute(
+                    insert(Battle).returning(Battle.id, sort_by_parameter_order=True),
+                    [entry["battle"] for entry in chunk],
+                )
+                .scalars()
+                .all()
+            )
+
+            participant_rows = []
+            deltas_by_season = {}
+            for battle_id, entry in zip(battle_ids, chunk):
+                for participant in entry["participants"]:
+                    participant_rows.append({**participant, "battle_id": battle_id})
+                deltas = deltas_by_season.setdefault(entry["battle"]["season_id"], [])
+                deltas.extend(entry["participants"])
+            if participant_rows:
+                db.session.execute(insert(BattleParticipant), participant_rows)
+            for season_id, rows in deltas_by_season.items():
+                apply_stats_deltas(team_id, season_id, participant_stats_deltas(rows))
+
+            bump_team_version(team_id)
+            publish_change(team_id, "battle", battle_ids)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            errors.append(
+                {"row": None, "error": f"Failed to import battle chunk: {str(e)}"}
+            )
+            continue
+        battles_imported += len(chunk)
+        participants_imported += len(participant_rows)
+
+    return jsonify(
+        {
+            "battles_imported": battles_imported,
+            "participants_imported": participants_imported,
+            "errors": errors,
+        }
+    ), 200
+
+
+@app.route("/api/cache/stats", methods=["GET"])
+@login_required
+def get_cache_stats():
+    if not is_superadmin():
+        return jsonify({"error": "Superadmin access required"}), 403
+
+    # Counters are per worker process
+    return jsonify({"pid": os.getpid(), "response_cache": response_cache.stats()})
+
+
+# Hot queries and the index EXPLAIN QUERY PLAN is expected to report for them
+INDEXED_QUERIES = [
+    (
+        "SELECT id FROM battle WHERE team_id = 1 AND season_id = 1 "
+        "ORDER BY date_created DESC",
+        "ix_battle_team_season_created",
+    ),
+    (
+        "SELECT battle_id FROM battle_participant WHERE player_id = 1",
+        "ix_battle_participant_player_battle",
+    ),
+    (
+        "SELECT damage_done FROM battle_participant WHERE battle_id = 1",
+        "ix_battle_participant_battle",
+    ),
+    (
+        "SELECT id FROM player WHERE team_id = 1 AND status = 'active'",
+        "ix_player_team_status",
+    ),
+    (
+        "SELECT id FROM season WHERE team_id = 1 ORDER BY date_created DESC",
+        "ix_season_team_created",
+    ),
+]
+
+
+def check_query_plans():
+    """Return (query, expected_index, plan) for hot queries not using their index"""
+    failures = []
+    for query, index_name in INDEXED_QUERIES:
+        plan = " | ".join(
+            row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {query}"))
+        )
+        if index_name not in plan:
+            failures.append((query, index_name, plan))
+    return failures
+
+
+@app.cli.command("check-indexes")
+def check_indexes_command():
+    """Verify via EXPLAIN QUERY PLAN that the hot queries use their indexes"""
+    failures = check_query_plans()
+    for query, index_name, plan in failures:
+        print(f"NOT USING {index_name}: {query}\n    plan: {plan}")
+    if failures:
+        raise SystemExit(1)
+    print(f"All {len(INDEXED_QUERIES)} hot queries use their indexes")
+
+
+# Ordered registry of (version, description, function) schema migrations
+SCHEMA_MIGRATIONS = []
+
+
+def schema_migration(version, description):
+    """Register a schema migration; versions must be added in increasing order"""
+
+    def decorator(func):
+        if SCHEMA_MIGRATIONS and version <= SCHEMA_MIGRATIONS[-1][0]:
+            raise ValueError(f"Schema migration {version} is out of order")
+        SCHEMA_MIGRATIONS.append((version, description, func))
+        return func
+
+    return decorator
+
+
+@schema_migration(1, "Upgrade pre-multi-team databases")
+def migrate_legacy_schema():
+    """Column and table upgrades for databases created by older releases"""
     # SQLite-specific SQL syntax
     auto_increment = "AUTOINCREMENT"
     datetime_default = "DEFAULT CURRENT_TIMESTAMP"
@@ -1750,7 +4089,59 @@ def run_migrations():
         db.session.commit()
         print("Team_id column added to season table successfully!")
 
-    # Create admin user if it doesn't exist
+
+@schema_migration(2, "Add composite indexes for team/season-scoped queries")
+def migrate_composite_indexes():
+    # The indexes are declared once, in the models' __table_args__
+    connection = db.session.connection()
+    for model in (Battle, BattleParticipant, Player, Season):
+        for index in model.__table__.indexes:
+            index.create(connection, checkfirst=True)
+    db.session.commit()
+
+
+@schema_migration(3, "Add team data_version for conditional GETs")
+def migrate_team_data_version():
+    try:
+        db.session.execute(text("SELECT data_version FROM team LIMIT 1"))
+    except Exception:
+        db.session.rollback()
+        print("Adding data_version column to team table...")
+        db.session.execute(
+            text("ALTER TABLE team ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0")
+        )
+        db.session.commit()
+        print("Data_version column added to team table successfully!")
+
+
+@schema_migration(4, "Backfill player_season_stats")
+def migrate_player_season_stats():
+    rebuild_player_season_stats()
+
+
+@schema_migration(5, "Add change_log table for live updates")
+def migrate_change_log():
+    ChangeLog.__table__.create(db.engine, checkfirst=True)
+
+
+@schema_migration(6, "Add access_generation table for principal cache invalidation")
+def migrate_access_generation():
+    AccessGeneration.__table__.create(db.engine, checkfirst=True)
+
+
+def get_schema_version():
+    """Read the schema version; 0 for databases that predate versioning"""
+    try:
+        return (
+            db.session.execute(text("SELECT version FROM schema_version")).scalar() or 0
+        )
+    except Exception:
+        db.session.rollback()
+        return 0
+
+
+def ensure_admin_user():
+    """Create the superadmin account if it doesn't exist"""
     try:
         # Use default username if not set in environment
         su_username = os.getenv("su_username", "admin")
@@ -1772,7 +4163,37 @@ def run_migrations():
         print(f"Error creating admin user: {e}")
         raise
 
-    print("Database migration completed for SQLite!")
+
+def run_migrations():
+    """Apply pending schema migrations and record the new schema version"""
+    db.session.execute(
+        text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)")
+    )
+    if db.session.execute(text("SELECT COUNT(*) FROM schema_version")).scalar() == 0:
+        db.session.execute(text("INSERT INTO schema_version (version) VALUES (0)"))
+    db.session.commit()
+
+    db.create_all()
+
+    current_version = get_schema_version()
+    for version, description, migration in SCHEMA_MIGRATIONS:
+        if version <= current_version:
+            continue
+        print(f"Applying migration {version}: {description}...")
+        migration()
+        db.session.execute(
+            text("UPDATE schema_version SET version = :version"), {"version": version}
+        )
+        db.session.commit()
+
+    ensure_admin_user()
+    print(f"Database schema is at version {SCHEMA_MIGRATIONS[-1][0]}")
+
+
+@app.cli.command("migrate")
+def migrate_command():
+    """Apply pending schema migrations and ensure the admin user exists"""
+    run_migrations()
 
 
 # Security fix: Add generic error handler to prevent information disclosure
@@ -1803,10 +4224,52 @@ def set_security_headers(response):
     return response
 
 
-# Initialize database when app starts (for Heroku and other WSGI deployments)
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def report_query_stats(response):
+    """Expose the request's SQL statement count and DB time, and log them"""
+    query_count = g.get("query_count", 0)
+    query_ms = g.get("query_time", 0.0) * 1000
+    total_ms = (
+        time.perf_counter() - g.get("request_started", time.perf_counter())
+    ) * 1000
+    response.headers["X-Query-Count"] = str(query_count)
+    response.headers["Server-Timing"] = (
+        f'db;dur={query_ms:.1f};desc="{query_count} queries", app;dur={total_ms:.1f}'
+    )
+
+    endpoint = request.endpoint or request.path
+    app.logger.info(
+        f"{request.method} {endpoint}: {query_count} queries, "
+        f"{query_ms:.1f}ms db, {total_ms:.1f}ms total"
+    )
+    if QUERY_WARN_THRESHOLD and query_count > QUERY_WARN_THRESHOLD:
+        app.logger.warning(
+            f"{request.method} {endpoint} issued {query_count} queries "
+            f"(threshold {QUERY_WARN_THRESHOLD})"
+        )
+    return response
+
+
+# Initialize database when app starts (for Heroku and other WSGI deployments).
+# A migrated database only costs a version read and an admin lookup; set
+# AUTO_MIGRATE=false to leave migrations entirely to `flask migrate`.
+AUTO_MIGRATE = os.getenv("AUTO_MIGRATE", "true").lower() == "true"
+
 with app.app_context():
-    db.create_all()
-    run_migrations()
+    if AUTO_MIGRATE:
+        if get_schema_version() < SCHEMA_MIGRATIONS[-1][0]:
+            run_migrations()
+        else:
+            # Checked on every boot, so an admin creation that failed after
+            # the schema was migrated is retried
+            ensure_admin_user()
+    if db.engine.dialect.name == "sqlite":
+        log_sqlite_profile()
 
 if __name__ == "__main__":
     # Security fix: Debug mode from environment variable
@@ -46,3 +46,10 @@ def pre_fork(server, worker):
 
 def post_fork(server, worker):
     server.log.info("Worker spawned (pid: %s)", worker.pid)
+
+    # With preload_app the master opened SQLite connections while running
+    # migrations; drop them so each worker opens (and tunes) its own
+    from app import app, db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
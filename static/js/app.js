@@ -1,5 +1,45 @@
-const { useState, useEffect } = React;
+const { useState, useEffect, useRef } = React;
 
+// Number of battles fetched per page of the battle history
+const BATTLE_PAGE_SIZE = 50;
+
+// How often the dashboard polls for other officers' changes to the team
+const LIVE_POLL_INTERVAL_MS = 10000;
+
+
+// Last ETag and body seen per team-scoped GET URL
+const etagCache = new Map();
+
+// Fetch with If-None-Match; a 304 is answered from the cached body
+async function conditionalFetch(url) {
+  const cached = etagCache.get(url);
+  const response = await fetch(url, {
+    headers: cached ? { "If-None-Match": cached.etag } : {},
+  });
+
+  if (response.status === 304 && cached) {
+    return new Response(cached.body, {
+      status: 200,
+      headers: { "Content-Type": "application/json" },
+    });
+  }
+
+  const etag = response.headers.get("ETag");
+  if (response.ok && etag) {
+    etagCache.set(url, { etag, body: await response.clone().text() });
+  }
+  return response;
+}
+
+// Replace the item with the same id (keeping fields the update lacks) or add it
+function upsertById(items, item, prepend = false) {
+  if (items.some((existing) => existing.id === item.id)) {
+    return items.map((existing) =>
+      existing.id === item.id ? { ...existing, ...item } : existing
+    );
+  }
+  return prepend ? [item, ...items] : [...items, item];
+}
 
 // Utility function to format damage numbers with abbreviations
 function formatDamage(number) {
@@ -578,7 +618,8 @@ function PlayerList({ players, onPlayerDeleted, onAddToRoster, roster, showModal
       if (response.ok) {
         onPlayerDeleted(playerId);
       } else {
-        showModal("Failed to delete player", "Error", "error");
+        const errorData = await response.json();
+        showModal(errorData.error || "Failed to delete player", "Error", "error");
       }
     } catch (error) {
       showModal("Network error occurred", "Error", "error");
@@ -1035,9 +1076,31 @@ function BattleEdit({ battle, onBattleUpdated, onCancel, currentSeason }) {
   );
 }
 
-function BattleList({ battles, onBattleDeleted, onBattleUpdated, currentSeason, showModal }) {
+function BattleList({
+  battles,
+  onBattleDeleted,
+  onBattleUpdated,
+  currentSeason,
+  showModal,
+  hasMore = false,
+  onLoadMore,
+}) {
   const [deletingId, setDeletingId] = useState(null);
   const [editingBattle, setEditingBattle] = useState(null);
+  const loadMoreRef = useRef(null);
+
+  // Infinite scroll: load the next page when the sentinel scrolls into view
+  useEffect(() => {
+    if (!hasMore || !onLoadMore || !loadMoreRef.current) return;
+
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) {
+        onLoadMore();
+      }
+    });
+    observer.observe(loadMoreRef.current);
+    return () => observer.disconnect();
+  }, [hasMore, onLoadMore, battles.length, editingBattle]);
 
   const handleDelete = async (battleId) => {
     // TODO: Convert to modal confirmation
@@ -1092,7 +1155,7 @@ function BattleList({ battles, onBattleDeleted, onBattleUpdated, currentSeason,
 
   return (
     <div className="battles-list">
-      <h2>Battle History ({battles.length})</h2>
+      <h2>Battle History ({battles.length}{hasMore ? "+" : ""})</h2>
       {battles.length === 0 ? (
         <p>No battles recorded yet.</p>
       ) : (
@@ -1149,6 +1212,11 @@ function BattleList({ battles, onBattleDeleted, onBattleUpdated, currentSeason,
               </div>
             </div>
           ))}
+          {hasMore && (
+            <div ref={loadMoreRef} className="loading">
+              Loading more battles...
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -1168,6 +1236,8 @@ function AdminDashboard({
   onCreateSeason,
   battles,
   onBattleUpdated,
+  hasMoreBattles,
+  onLoadMoreBattles,
   currentTeam,
 }) {
   const [updatingId, setUpdatingId] = useState(null);
@@ -1478,6 +1548,8 @@ function AdminDashboard({
                 onBattleDeleted={() => {}}
                 onBattleUpdated={onBattleUpdated}
                 currentSeason={currentSeason}
+                hasMore={hasMoreBattles}
+                onLoadMore={onLoadMoreBattles}
               />
             )}
           </div>
@@ -2201,6 +2273,8 @@ function App() {
   const [players, setPlayers] = useState([]);
   const [roster, setRoster] = useState([]);
   const [battles, setBattles] = useState([]);
+  const [battlesCursor, setBattlesCursor] = useState(null);
+  const [loadingMoreBattles, setLoadingMoreBattles] = useState(false);
   const [playerStats, setPlayerStats] = useState({});
   const [seasons, setSeasons] = useState([]);
   const [currentSeason, setCurrentSeason] = useState(null);
@@ -2237,26 +2311,12 @@ function App() {
   const [authLoading, setAuthLoading] = useState(true);
   const [teams, setTeams] = useState([]);
   const [currentTeam, setCurrentTeam] = useState(null);
-
-  const checkAuth = async () => {
-    try {
-      const response = await fetch("/api/auth/status");
-      if (response.ok) {
-        const data = await response.json();
-        setIsAuthenticated(data.authenticated);
-        setUser(data.user);
-      } else {
-        setIsAuthenticated(false);
-        setUser(null);
-      }
-    } catch (error) {
-      console.error("Error checking auth:", error);
-      setIsAuthenticated(false);
-      setUser(null);
-    } finally {
-      setAuthLoading(false);
-    }
-  };
+  const bootstrapKey = useRef(null);
+  const statsRefreshTimer = useRef(null);
+  // Last change sequence applied for the current team, and the latest delta
+  // handler so the poll loop sees the current page and season
+  const liveSeq = useRef(null);
+  const applyDeltaRef = useRef(null);
 
   const handleLogout = async () => {
     try {
@@ -2271,63 +2331,51 @@ function App() {
     }
   };
 
-  const fetchTeams = async () => {
+  // Load auth state, teams and the selected team/season's data in one request
+  const loadBootstrap = async (teamId = null, seasonId = null) => {
     try {
-      const response = await fetch("/api/auth/teams");
+      const params = new URLSearchParams();
+      if (teamId) params.set("team_id", teamId);
+      if (seasonId) params.set("season_id", seasonId);
+      const response = await fetch(`/api/bootstrap?${params}`);
       if (response.ok) {
         const data = await response.json();
-        setTeams(data);
-
-        // Set current team to first if not already set
-        if (!currentTeam && data.length > 0) {
-          setCurrentTeam(data[0]);
-        }
-        
-        // If user has no teams, set loading to false to show the "no teams" message
-        if (data.length === 0) {
-          setLoading(false);
-        }
-      } else {
-        if (response.status === 401) {
-          window.location.href = "/login";
-          return;
-        }
-        setError("Failed to fetch teams");
-        setLoading(false);
-      }
-    } catch (error) {
-      setError("Network error occurred");
-      setLoading(false);
-    }
-  };
-
-  const fetchSeasons = async () => {
-    try {
-      const url = currentTeam ? `/api/seasons?team_id=${currentTeam.id}` : "/api/seasons";
-      const response = await fetch(url);
-      if (response.ok) {
-        const data = await response.json();
-        setSeasons(data);
-
-        // Set current season to newest if not already set
-        if (!currentSeason && data.length > 0) {
-          setCurrentSeason(data[0]); // First item is newest due to desc order
-        }
-
-        // If no seasons exist, set loading to false here
-        if (data.length === 0) {
-          setLoading(false);
-        }
+        setIsAuthenticated(data.authenticated);
+        setUser(data.user);
+        if (!data.authenticated) return;
+
+        // Let the page effect skip refetching what this response already holds
+        bootstrapKey.current = `${currentPage}:${data.current_team?.id}:${data.current_season?.id}`;
+        liveSeq.current = data.current_team
+          ? { teamId: data.current_team.id, seq: data.seq }
+          : null;
+        setTeams(data.teams);
+        setCurrentTeam(data.current_team);
+        setSeasons(data.seasons);
+        setCurrentSeason(data.current_season);
+        setPlayers(data.players);
+        setRoster(data.roster);
+        setBattles(data.battles.items);
+        setBattlesCursor(data.battles.next_cursor);
+        const stats = {};
+        data.roster_stats.forEach((playerStatsData) => {
+          stats[playerStatsData.player_id] = playerStatsData;
+        });
+        setPlayerStats(stats);
+        setError("");
       } else {
         if (response.status === 401) {
           window.location.href = "/login";
           return;
         }
-        setError("Failed to fetch seasons");
-        setLoading(false);
+        const errorData = await response.json();
+        setError(errorData.error || "Failed to load data");
       }
     } catch (error) {
+      console.error("Error loading data:", error);
       setError("Network error occurred");
+    } finally {
+      setAuthLoading(false);
       setLoading(false);
     }
   };
@@ -2340,7 +2388,7 @@ function App() {
       }
       setError(""); // Clear any previous errors
       const url = `/api/players?status=active&team_id=${currentTeam.id}`;
-      const response = await fetch(url);
+      const response = await conditionalFetch(url);
       if (response.ok) {
         const data = await response.json();
         setPlayers(data);
@@ -2364,7 +2412,7 @@ function App() {
       }
       setError(""); // Clear any previous errors
       const url = `/api/players?status=all&team_id=${currentTeam.id}`;
-      const response = await fetch(url);
+      const response = await conditionalFetch(url);
       if (response.ok) {
         const data = await response.json();
         setPlayers(data);
@@ -2385,7 +2433,7 @@ function App() {
 
     try {
       const url = `/api/players/roster?season_id=${currentSeason.id}&team_id=${currentTeam.id}`;
-      const response = await fetch(url);
+      const response = await conditionalFetch(url);
       if (response.ok) {
         const data = await response.json();
         setRoster(data);
@@ -2403,18 +2451,22 @@ function App() {
     }
   };
 
-  const fetchBattles = async () => {
+  const fetchBattles = async (cursor = null) => {
     if (!currentSeason) return;
 
     try {
-      let url = `/api/battles?season_id=${currentSeason.id}`;
+      let url = `/api/battles?season_id=${currentSeason.id}&limit=${BATTLE_PAGE_SIZE}`;
       if (currentTeam) {
         url += `&team_id=${currentTeam.id}`;
       }
-      const response = await fetch(url);
+      if (cursor) {
+        url += `&cursor=${encodeURIComponent(cursor)}`;
+      }
+      const response = await conditionalFetch(url);
       if (response.ok) {
         const data = await response.json();
-        setBattles(data);
+        setBattles((prev) => (cursor ? [...prev, ...data.items] : data.items));
+        setBattlesCursor(data.next_cursor);
       } else {
         setError("Failed to fetch battles");
       }
@@ -2423,28 +2475,30 @@ function App() {
     }
   };
 
+  const loadMoreBattles = async () => {
+    if (!battlesCursor || loadingMoreBattles) return;
+
+    setLoadingMoreBattles(true);
+    try {
+      await fetchBattles(battlesCursor);
+    } finally {
+      setLoadingMoreBattles(false);
+    }
+  };
+
   const fetchPlayerStats = async () => {
     if (!currentSeason || !currentTeam) return;
 
     try {
-      const rosterResponse = await fetch(
-        `/api/players/roster?season_id=${currentSeason.id}&team_id=${currentTeam.id}`
+      const statsResponse = await conditionalFetch(
+        `/api/players/roster/battle-stats?season_id=${currentSeason.id}&team_id=${currentTeam.id}`
       );
-      if (rosterResponse.ok) {
-        const rosterData = await rosterResponse.json();
+      if (statsResponse.ok) {
+        const statsData = await statsResponse.json();
         const stats = {};
-
-        await Promise.all(
-          rosterData.map(async (player) => {
-            const statsResponse = await fetch(
-              `/api/players/${player.id}/battle-stats?season_id=${currentSeason.id}`
-            );
-            if (statsResponse.ok) {
-              const playerStatsData = await statsResponse.json();
-              stats[player.id] = playerStatsData;
-            }
-          })
-        );
+        statsData.forEach((playerStatsData) => {
+          stats[playerStatsData.player_id] = playerStatsData;
+        });
 
         setPlayerStats(stats);
       }
@@ -2454,15 +2508,9 @@ function App() {
   };
 
   useEffect(() => {
-    checkAuth();
+    loadBootstrap();
   }, []);
 
-  useEffect(() => {
-    if (isAuthenticated && !authLoading) {
-      fetchTeams();
-    }
-  }, [isAuthenticated, authLoading]);
-
   useEffect(() => {
     if (user) {
       if (user.is_superadmin) {
@@ -2481,50 +2529,150 @@ function App() {
     }
   }, [user, currentPage]);
 
-  useEffect(() => {
-    if (currentTeam) {
-      fetchSeasons();
-    }
-  }, [currentTeam]);
-
   useEffect(() => {
     if (!currentTeam) return; // Don't fetch data if no team is selected
-    
+
+    // Skip what the bootstrap response for this page/team/season already loaded
+    const bootstrapped =
+      bootstrapKey.current === `${currentPage}:${currentTeam.id}:${currentSeason?.id}`;
+    bootstrapKey.current = null;
+
     if (currentPage === "players") {
+      if (bootstrapped) return;
       fetchPlayers();
       if (currentSeason) {
         fetchRoster();
         fetchPlayerStats();
       }
     } else if (currentPage === "battles") {
-      if (!currentSeason) return;
+      if (!currentSeason || bootstrapped) return;
       fetchBattles();
       fetchRoster();
     } else {
       fetchAllPlayers();
-      if (currentSeason) {
+      if (currentSeason && !bootstrapped) {
         fetchBattles();
       }
     }
   }, [currentPage, currentSeason, currentTeam]);
 
+  // Coalesce bursts of live battle/roster changes into one stats refetch
+  const scheduleStatsRefresh = () => {
+    clearTimeout(statsRefreshTimer.current);
+    statsRefreshTimer.current = setTimeout(fetchPlayerStats, 500);
+  };
+
+  // Patch local state from one changed row of the team's delta feed
+  const applyChange = ({ entity, id, action, data }) => {
+    const gone = action === "delete" || !data;
+    if (entity === "battle") {
+      if (gone || data.season_id !== currentSeason?.id) {
+        setBattles((prev) => prev.filter((battle) => battle.id !== id));
+      } else {
+        setBattles((prev) => upsertById(prev, data, true));
+      }
+      scheduleStatsRefresh();
+    } else if (entity === "player") {
+      if (gone || data.status === "inactive") {
+        setRoster((prev) => prev.filter((player) => player.id !== id));
+      }
+      if (gone || (data.status === "inactive" && currentPage !== "manage")) {
+        setPlayers((prev) => prev.filter((player) => player.id !== id));
+      } else {
+        setPlayers((prev) => upsertById(prev, data));
+      }
+    } else if (entity === "roster") {
+      if (!gone && id === currentSeason?.id) {
+        setRoster(data);
+        scheduleStatsRefresh();
+      }
+    } else if (entity === "season") {
+      if (gone) {
+        handleSeasonDeleted(id);
+      } else {
+        handleSeasonUpdated(data);
+        setSeasons((prev) => upsertById(prev, data, true));
+      }
+    } else if (entity === "team" && !gone) {
+      setTeams((prev) => upsertById(prev, data));
+    }
+  };
+
+  // Apply one response of the delta endpoint
+  const applyDelta = (delta) => {
+    if (delta.full) {
+      // Our sequence predates the retained change log; reload from scratch
+      loadBootstrap(currentTeam?.id, currentSeason?.id);
+      return;
+    }
+    const upsert = (entity) => (data) =>
+      applyChange({ entity, id: data.id, action: "upsert", data });
+    const remove = (entity) => (id) =>
+      applyChange({ entity, id, action: "delete", data: null });
+    delta.seasons.forEach(upsert("season"));
+    delta.players.forEach(upsert("player"));
+    delta.battles.forEach(upsert("battle"));
+    Object.entries(delta.rosters).forEach(([seasonId, data]) =>
+      applyChange({ entity: "roster", id: Number(seasonId), action: "upsert", data })
+    );
+    if (delta.team) upsert("team")(delta.team);
+    delta.deleted.seasons.forEach(remove("season"));
+    delta.deleted.players.forEach(remove("player"));
+    delta.deleted.battles.forEach(remove("battle"));
+  };
+  applyDeltaRef.current = applyDelta;
+
+  // Follow other officers' changes to this team by polling the delta endpoint
+  // with the last applied sequence; one loop per team, so nothing is missed
+  // across page or season switches
+  useEffect(() => {
+    if (!currentTeam) return;
+
+    const teamId = currentTeam.id;
+    let cancelled = false;
+    let timer = null;
+    const poll = async () => {
+      let hasMore = false;
+      const since = liveSeq.current?.teamId === teamId ? liveSeq.current.seq : null;
+      if (since !== null) {
+        try {
+          const response = await fetch(
+            `/api/teams/${teamId}/changes?since=${since}`
+          );
+          if (response.ok) {
+            const delta = await response.json();
+            if (!cancelled && liveSeq.current?.seq === since) {
+              if (!delta.full) liveSeq.current = { teamId, seq: delta.seq };
+              applyDeltaRef.current(delta);
+              hasMore = delta.has_more;
+            }
+          }
+        } catch (error) {
+          console.error("Error polling team changes:", error);
+        }
+      }
+      if (!cancelled) timer = setTimeout(poll, hasMore ? 0 : LIVE_POLL_INTERVAL_MS);
+    };
+    timer = setTimeout(poll, LIVE_POLL_INTERVAL_MS);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+      clearTimeout(statsRefreshTimer.current);
+    };
+  }, [currentTeam?.id]);
+
   const handleTeamChange = (team) => {
-    setCurrentTeam(team);
-    setCurrentSeason(null); // Reset season when team changes
-    setPlayers([]);
-    setBattles([]);
-    setRoster([]);
-    setPlayerStats({});
-    setError(""); // Clear any previous errors when team changes
+    // Reload everything for the new team, defaulting to its newest season
+    loadBootstrap(team.id);
   };
 
   const handleTeamCreated = (newTeam) => {
     setTeams((prev) => [...prev, newTeam]);
-    setCurrentTeam(newTeam);
+    loadBootstrap(newTeam.id);
   };
 
   const handlePlayerAdded = (newPlayer) => {
-    setPlayers((prev) => [...prev, newPlayer]);
+    setPlayers((prev) => upsertById(prev, newPlayer));
   };
 
   const handlePlayerDeleted = (playerId) => {
@@ -2621,6 +2769,8 @@ function App() {
     }
   };
 
+  // Moves and swaps touch only the affected roster rows, so entries added by
+  // other officers (or hidden from this view) are never overwritten
   const handleMovePlayer = async (playerId, newPosition) => {
     try {
       const response = await fetch(`/api/players/${playerId}/roster`, {
@@ -2637,7 +2787,8 @@ function App() {
       if (response.ok) {
         fetchRoster();
       } else {
-        showModal("Failed to move player", "Error", "error");
+        const errorData = await response.json();
+        showModal(`Failed to move player: ${errorData.error || "Unknown error"}`, "Error", "error");
       }
     } catch (error) {
       showModal("Network error occurred", "Error", "error");
@@ -2646,16 +2797,6 @@ function App() {
 
   const handleSwapPlayers = async (playerId1, playerId2) => {
     try {
-      // Get the current positions of both players
-      const player1 = roster.find((p) => p.id === playerId1);
-      const player2 = roster.find((p) => p.id === playerId2);
-
-      if (!player1 || !player2) {
-        showModal("Error: Could not find players to swap", "Error", "error");
-        return;
-      }
-
-      // Use the new swap endpoint
       const response = await fetch("/api/players/swap-roster", {
         method: "PUT",
         headers: {
@@ -2669,7 +2810,18 @@ function App() {
       });
 
       if (response.ok) {
-        fetchRoster();
+        const data = await response.json();
+        const positions = {
+          [data.player1.id]: data.player1.position,
+          [data.player2.id]: data.player2.position,
+        };
+        setRoster((prev) =>
+          prev
+            .map((p) =>
+              p.id in positions ? { ...p, roster_position: positions[p.id] } : p
+            )
+            .sort((a, b) => a.roster_position - b.roster_position)
+        );
       } else {
         const errorData = await response.json();
         showModal(`Failed to swap players: ${errorData.error || "Unknown error"}`, "Error", "error");
@@ -2680,7 +2832,7 @@ function App() {
   };
 
   const handleBattleAdded = (newBattle) => {
-    setBattles((prev) => [newBattle, ...prev]);
+    setBattles((prev) => upsertById(prev, newBattle, true));
     fetchPlayerStats();
   };
 
@@ -2699,7 +2851,7 @@ function App() {
   };
 
   const handleSeasonChange = (season) => {
-    setCurrentSeason(season);
+    loadBootstrap(currentTeam?.id, season.id);
   };
 
   const handleSeasonCreated = (newSeason) => {
@@ -2847,6 +2999,8 @@ function App() {
               onBattleUpdated={handleBattleUpdated}
               currentSeason={currentSeason}
               showModal={showModal}
+              hasMore={!!battlesCursor}
+              onLoadMore={loadMoreBattles}
             />
           </div>
         )
@@ -2864,6 +3018,8 @@ function App() {
           onCreateSeason={handleSeasonCreated}
           battles={battles}
           onBattleUpdated={handleBattleUpdated}
+          hasMoreBattles={!!battlesCursor}
+          onLoadMoreBattles={loadMoreBattles}
           currentTeam={currentTeam}
         />
       )}